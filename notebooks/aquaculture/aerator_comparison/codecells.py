@@ -7,14 +7,26 @@
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
 from matplotlib.ticker import NullFormatter
 import seaborn as sns
 from typing import List, Optional
+import math
+from string import Template
+from types import MappingProxyType
 import warnings
-from scipy.interpolate import make_interp_spline
+from functools import lru_cache
+from scipy.interpolate import PchipInterpolator
+from scipy.optimize import brentq
 from IPython.display import display, HTML
+import jinja2
 
-warnings.filterwarnings("ignore")
+# Silence only known third-party deprecation noise; keep pandas
+# PerformanceWarning and NumPy RuntimeWarning visible
+warnings.filterwarnings("ignore", category=FutureWarning, module="seaborn")
+warnings.filterwarnings(
+    "ignore", category=DeprecationWarning, module="matplotlib"
+)
 
 # Set up plotting style
 plt.style.use("seaborn-v0_8")
@@ -31,6 +43,7 @@ pond_volume_m3 = area_m2 * pond_depth  # Pond volume in cubic meters
 farm_temp = 31.5  # Average farm temperature in °C
 standard_temp = 20  # Standard temperature for SOTR measurements
 theta = 1.024  # Temperature coefficient for oxygen transfer
+THETA_TEMP_FACTOR = theta ** (farm_temp - standard_temp)  # SOTR -> OTRT
 
 # Aquaculture parameters
 culture_period_days = 120  # Days per culture cycle
@@ -105,12 +118,20 @@ aerator_specs = {
 
 # Extract data for analysis
 aerator_names = list(aerator_specs.keys())
-prices = [aerator_specs[name]["price"] for name in aerator_names]
-sotr_values = [aerator_specs[name]["sotr"] for name in aerator_names]
-sotr_per_dollar = [
-    aerator_specs[name]["sotr"] / aerator_specs[name]["price"]
-    for name in aerator_names
-]
+
+# Read-only column arrays (one per spec field) derived once from the specs
+AERATOR_SPECS_SOA = MappingProxyType(
+    {
+        field: np.array([aerator_specs[name][field] for name in aerator_names])
+        for field in aerator_specs[aerator_names[0]]
+    }
+)
+for column in AERATOR_SPECS_SOA.values():
+    column.setflags(write=False)
+
+prices = AERATOR_SPECS_SOA["price"]
+sotr_values = AERATOR_SPECS_SOA["sotr"].astype(np.float64)
+sotr_per_dollar = sotr_values / prices
 
 # Calculate comprehensive performance metrics for each aerator
 performance_data = {}
@@ -128,10 +149,10 @@ for name, specs in aerator_specs.items():
     durability = specs["durability"]
 
     # Temperature correction for SOTR
-    otrt = sotr * (theta ** (farm_temp - standard_temp))
+    otrt = sotr * THETA_TEMP_FACTOR
 
     # Calculate number of aerators needed to meet oxygen demand
-    num_aerators = max(1, int(np.ceil(total_oxygen_demand / (otrt))))
+    num_aerators = max(1, math.ceil(total_oxygen_demand / otrt))
 
     # Calculate performance metrics
     daily_o2_per_aerator = otrt * daily_operation_hours
@@ -220,63 +241,67 @@ for name in aerator_names:
 
 
 # Advanced Financial Analysis Functions
-def calculate_npv(
-    initial_investment: float,
-    annual_cash_flow: float,
-    years: int,
-    discount_rate: float,
-) -> float:
-    """Calculate Net Present Value for investment analysis."""
+@lru_cache(maxsize=None)
+def annuity_factor(years: int, discount_rate: float) -> float:
+    """Present value of a level annual cash flow of 1 over the given years."""
     if discount_rate == 0:
-        return annual_cash_flow * years - initial_investment
-
-    pv_cash_flows = sum(
-        [
-            annual_cash_flow / ((1 + discount_rate) ** year)
-            for year in range(1, years + 1)
-        ]
-    )
-    return pv_cash_flows - initial_investment
+        return float(years)
+    return (1 - (1 + discount_rate) ** -years) / discount_rate
 
 
 def calculate_irr(
     initial_investment: float,
     annual_cash_flows: List[float],
-    max_iterations: int = 1000,
+    max_iterations: int = 100,
 ) -> Optional[float]:
-    """Calculate Internal Rate of Return using Newton-Raphson method."""
-
-    def npv_function(rate: float) -> float:
-        return (
-            sum(
-                [
-                    cf / ((1 + rate) ** (i + 1))
-                    for i, cf in enumerate(annual_cash_flows)
-                ]
-            )
-            - initial_investment
-        )
+    """
+    Calculate Internal Rate of Return.
 
-    def npv_derivative(rate: float) -> float:
-        return sum(
-            [
-                -(i + 1) * cf / ((1 + rate) ** (i + 2))
-                for i, cf in enumerate(annual_cash_flows)
-            ]
-        )
+    Level annuities (constant cash flows) are solved with a bracketed Brent
+    search; other cash flow profiles use Halley's method, which converges in
+    a handful of iterations.
+    """
+    cash_flows = np.asarray(annual_cash_flows, dtype=float)
+    years = np.arange(1, cash_flows.size + 1)
+
+    if cash_flows.size and np.all(cash_flows == cash_flows[0]):
+        cash_flow = cash_flows[0]
+
+        def annuity_npv(rate: float) -> float:
+            if rate == 0:
+                return cash_flow * cash_flows.size - initial_investment
+            factor = (1 - (1 + rate) ** -cash_flows.size) / rate
+            return cash_flow * factor - initial_investment
+
+        try:
+            return brentq(annuity_npv, -0.99, 10.0, xtol=1e-9, maxiter=60)
+        except (ValueError, RuntimeError):
+            pass  # No root inside the bracket - fall back to Halley
 
     # Initial guess
     rate = 0.1
     for _ in range(max_iterations):
-        npv_val = npv_function(rate)
+        growth = 1 + rate
+        discount = growth**years
+        npv_val = (cash_flows / discount).sum() - initial_investment
         if abs(npv_val) < 1e-6:
             return rate
 
-        npv_deriv = npv_derivative(rate)
+        npv_deriv = -(years * cash_flows / (discount * growth)).sum()
         if abs(npv_deriv) < 1e-10:
             return None
-
-        rate = rate - npv_val / npv_deriv
+        npv_deriv2 = (
+            years * (years + 1) * cash_flows / (discount * growth**2)
+        ).sum()
+
+        # Halley step; fall back to plain Newton far from the root where
+        # the curvature correction would overshoot or flip direction
+        newton_step = npv_val / npv_deriv
+        correction = 1 - newton_step * npv_deriv2 / (2 * npv_deriv)
+        if correction > 0.5:
+            rate = rate - newton_step / correction
+        else:
+            rate = rate - newton_step
 
         if rate < -0.99:  # Prevent negative rates below -99%
             rate = -0.99
@@ -284,85 +309,6 @@ def calculate_irr(
     return None
 
 
-def calculate_payback_period(
-    initial_investment: float, annual_savings: float
-) -> Optional[float]:
-    """Calculate simple payback period in years."""
-    if annual_savings <= 0:
-        return None
-    return initial_investment / annual_savings
-
-
-def calculate_profitability_index(
-    initial_investment: float,
-    annual_cash_flow: float,
-    years: int,
-    discount_rate: float,
-) -> Optional[float]:
-    """Calculate Profitability Index (PI) for investment analysis."""
-    npv = calculate_npv(
-        initial_investment, annual_cash_flow, years, discount_rate
-    )
-    if npv is None or initial_investment <= 0:
-        return None
-    return (npv + initial_investment) / initial_investment
-
-
-def calculate_roi(
-    initial_investment: float,
-    annual_cash_flow: float,
-    years: int,
-) -> Optional[float]:
-    """Calculate Return on Investment (ROI) as a percentage."""
-    if initial_investment <= 0:
-        return None
-    total_cash_flow = annual_cash_flow * years
-    return (total_cash_flow - initial_investment) / initial_investment * 100
-
-
-def calculate_equilibrium_price(
-    annual_savings: float,
-    initial_investment: float,
-    analysis_years: int,
-    discount_rate: float,
-) -> Optional[float]:
-    """
-    Calculate the equilibrium price for an aerator based on annual savings,
-    initial investment, analysis period, and discount rate.
-
-    This function determines the price at which the present value of future
-    savings equals the initial investment, allowing for a realistic financial
-    assessment of aerator upgrades.
-
-    Parameters:
-    -----------
-    annual_savings : float
-        Expected annual savings from using the aerator.
-    initial_investment : float
-        Initial cost of the aerator.
-    analysis_years : int
-        Number of years over which savings are analyzed.
-    discount_rate : float
-        Discount rate to apply to future cash flows.
-
-    Returns:
-    --------
-    float or None
-        Equilibrium price if calculable, otherwise None.
-    """
-    if annual_savings <= 0 or initial_investment <= 0:
-        return None
-
-    pv_savings = calculate_npv(
-        0, annual_savings, analysis_years, discount_rate
-    )
-
-    if pv_savings <= 0:
-        return None
-
-    return initial_investment / pv_savings
-
-
 def calculate_marginal_metrics():
     """
     Calculate marginal benefits and costs for aerator upgrades.
@@ -445,207 +391,155 @@ def calculate_marginal_metrics():
 # Calculate marginal metrics
 marginal_metrics = calculate_marginal_metrics()
 
-# Calculate additional financial metrics using the new functions
-for name in aerator_names:
-    annual_savings = financial_metrics[name].get(
-        "annual_savings_vs_baseline", 0
+# Calculate additional financial metrics for all aerators in one vectorized pass
+# (relative to the least efficient aerator, following aerator_comparer.py methodology)
+initial_investments = np.array(
+    [financial_metrics[name]["initial_investment"] for name in aerator_names]
+)
+total_annual_costs = np.array(
+    [financial_metrics[name]["total_annual_cost"] for name in aerator_names]
+)
+ann_sav = np.array(
+    [
+        financial_metrics[name].get("annual_savings_vs_baseline", 0)
+        for name in aerator_names
+    ]
+)
+sotr_arr = np.array([performance_data[name]["sotr"] for name in aerator_names])
+
+# Read the least efficient (baseline) and winner references once
+lei_idx = aerator_names.index(least_efficient_name)
+winner_idx = aerator_names.index(winner_name)
+baseline_sotr = sotr_arr[lei_idx]
+baseline_inv = initial_investments[lei_idx]
+winner_cost = total_annual_costs[winner_idx]
+
+inv_diff = initial_investments - baseline_inv
+abs_inv_diff = np.abs(inv_diff)
+
+# SOTR ratio for scaling (compared to least efficient, not most efficient)
+sotr_ratio = sotr_arr / baseline_sotr
+
+is_baseline = np.arange(len(aerator_names)) == lei_idx
+saves = ann_sav > 0
+lower_inv = inv_diff <= 0
+# Very small positive investment differences use conservative scaling to
+# prevent mathematical explosion from tiny denominators
+small_inv = (inv_diff > 0) & (inv_diff <= 1000)
+# At least 10% better SOTR efficiency than the least efficient aerator
+efficient = sotr_ratio > 1.1
+
+# Present value of a level annual cash flow of 1 over the analysis period
+disc_factor = annuity_factor(analysis_years, real_discount_rate)
+
+# Only the level-annuity IRR needs root finding; everything else is closed-form
+needs_irr = saves & ~small_inv & (abs_inv_diff > 0)
+raw_irr = np.array(
+    [
+        calculate_irr(inv, [sav] * analysis_years) if solve else None
+        for inv, sav, solve in zip(abs_inv_diff, ann_sav, needs_irr)
+    ],
+    dtype=float,
+)
+
+with np.errstate(divide="ignore", invalid="ignore"):
+    npv_arr = ann_sav * disc_factor - inv_diff
+
+    irr_arr = np.select(
+        [
+            ~saves,
+            # Same price but better performance - infinite IRR, use 999%
+            lower_inv & (abs_inv_diff == 0),
+            # IRR failed or negative - first-year approximation, capped at 999%
+            lower_inv & ~(raw_irr >= 0),
+            lower_inv,
+            small_inv,
+        ],
+        [
+            0.0,
+            9.99,
+            np.minimum(9.99, ann_sav / abs_inv_diff - 1),
+            np.minimum(9.99, raw_irr),
+            np.minimum(0.3, ann_sav / 500000),
+        ],
+        default=np.nan_to_num(raw_irr, nan=0.0),
     )
-    initial_investment_diff = (
-        financial_metrics[name]["initial_investment"]
-        - financial_metrics[least_efficient_name]["initial_investment"]
+
+    pay_arr = np.where(saves, abs_inv_diff / ann_sav, np.nan)
+
+    pi_arr = np.select(
+        [
+            (inv_diff > 1000) & saves,
+            lower_inv & (ann_sav >= 0),
+            small_inv & saves,
+        ],
+        [
+            (npv_arr + inv_diff) / inv_diff,
+            np.where(efficient, 2.0, 1.0) + ann_sav / 1000000,
+            1.0 + ann_sav / 2000000,
+        ],
+        default=1.0,
     )
 
-    # SOTR ratio for scaling (compared to least efficient, not most efficient)
-    sotr_ratio = (
-        performance_data[name]["sotr"]
-        / performance_data[least_efficient_name]["sotr"]
+    roi_arr = np.select(
+        [
+            inv_diff > 1000,
+            lower_inv & saves & efficient,
+            lower_inv & saves & (abs_inv_diff > 100),
+            lower_inv & saves,
+            small_inv & saves,
+        ],
+        [
+            (ann_sav * analysis_years - inv_diff) / inv_diff * 100,
+            100.0 * sotr_ratio,
+            np.minimum(50.0, 100.0 * ann_sav / abs_inv_diff),
+            25.0,
+            np.minimum(50.0, (ann_sav / 10000) * 100),
+        ],
+        default=0.0,
     )
 
-    # Enhanced IRR calculation following aerator_comparer.py methodology
-    if name == least_efficient_name:
-        # Least efficient aerator: IRR = 0% (reference point)
-        irr = 0.0
-        npv = 0.0
-        payback = 0.0
-        profitability_index = 1.0
-        roi = 0.0
-        equilibrium_price = aerator_specs[name]["price"]
-    else:
-        # Other aerators: calculate relative to least efficient
-        if annual_savings > 0:
-            # This aerator saves money compared to least efficient
-            if initial_investment_diff <= 0:
-                # Lower investment AND saves money - calculate actual IRR
-                # For negative initial investment (lower cost), we need to use absolute value
-                # The IRR formula: sum(annual_savings/(1+IRR)^t) = abs(initial_investment_diff)
-                abs_investment_diff = abs(initial_investment_diff)
-                if abs_investment_diff > 0:
-                    # Calculate actual IRR using the standard formula
-                    cash_flows = [annual_savings] * analysis_years
-                    irr = calculate_irr(abs_investment_diff, cash_flows)
-                    if irr is None or irr < 0:
-                        # If calculation fails or gives negative result, use approximation
-                        # IRR ≈ (annual_savings / abs_investment_diff) - 1 for first year approximation
-                        irr = min(
-                            9.99, (annual_savings / abs_investment_diff) - 1
-                        )  # Cap at 999%
-                    else:
-                        # Cap at reasonable maximum for display purposes
-                        irr = min(9.99, irr)  # Cap at 999%
-                else:
-                    # Same price but better performance - infinite IRR, use high value
-                    irr = 9.99  # 999% IRR for display
-                payback = (
-                    abs(initial_investment_diff) / annual_savings
-                    if annual_savings > 0
-                    else 0.0
-                )
-            elif 0 < initial_investment_diff <= 1000:
-                # Very small positive investment difference - use conservative IRR
-                # This prevents unrealistic IRR calculations from tiny investments
-                irr = min(
-                    0.3, annual_savings / 500000
-                )  # Cap at 30%, conservative scaling
-                payback = calculate_payback_period(
-                    initial_investment_diff, annual_savings
-                )
-            else:
-                # Significant higher investment but saves money = standard IRR calculation
-                cash_flows = [annual_savings] * analysis_years
-                irr = calculate_irr(initial_investment_diff, cash_flows)
-                if irr is None:
-                    irr = 0.0
-                payback = calculate_payback_period(
-                    initial_investment_diff, annual_savings
-                )
-        elif annual_savings == 0:
-            # No savings compared to least efficient
-            irr = 0.0
-            payback = None
-        else:
-            # This should not happen since we're comparing to the least efficient
-            irr = 0.0
-            payback = None
-
-        # NPV calculation (relative to least efficient)
-        npv = calculate_npv(
-            initial_investment_diff,
-            annual_savings,
-            analysis_years,
-            real_discount_rate,
-        )
+    eq_price_arr = np.where(
+        saves & (initial_investments > 0),
+        initial_investments / (ann_sav * disc_factor),
+        np.nan,
+    )
 
-        # Profitability Index calculation
-        if initial_investment_diff > 1000 and annual_savings > 0:
-            profitability_index = calculate_profitability_index(
-                initial_investment_diff,
-                annual_savings,
-                analysis_years,
-                real_discount_rate,
-            )
-        elif initial_investment_diff <= 0 and annual_savings >= 0:
-            # Check if this aerator is actually more efficient than winner
-            if sotr_ratio > 1.1:  # At least 10% better SOTR efficiency
-                # Investment is lower and savings are non-negative AND more efficient
-                profitability_index = 2.0 + (annual_savings / 1000000)
-            else:
-                # Lower cost but not significantly more efficient - use standard calc
-                profitability_index = 1.0 + (annual_savings / 1000000)
-        elif 0 < initial_investment_diff <= 1000 and annual_savings > 0:
-            # Very small positive investment difference - use conservative profitability
-            # This prevents mathematical explosion from tiny denominators
-            profitability_index = 1.0 + (
-                annual_savings / 2000000
-            )  # Conservative scaling
-        else:
-            profitability_index = 1.0  # Same as baseline
-
-        # ROI calculation
-        if (
-            initial_investment_diff > 1000
-        ):  # Significant positive investment difference
-            roi = calculate_roi(
-                initial_investment_diff,
-                annual_savings,
-                analysis_years,
-            )
-        elif initial_investment_diff <= 0 and annual_savings > 0:
-            # Check if this aerator is actually more efficient than winner
-            if sotr_ratio > 1.1:  # At least 10% better SOTR efficiency
-                # Lower investment with savings and more efficient = high ROI
-                roi = 100.0 * sotr_ratio
-            else:
-                # Lower cost but not significantly more efficient - modest ROI
-                # Use a more reasonable calculation
-                if (
-                    abs(initial_investment_diff) > 100
-                ):  # Reasonable investment difference
-                    roi = min(
-                        50.0,
-                        100.0
-                        * (annual_savings / abs(initial_investment_diff)),
-                    )
-                else:
-                    # Very small or zero investment difference - use modest fixed ROI
-                    roi = 25.0
-        elif 0 < initial_investment_diff <= 1000 and annual_savings > 0:
-            # Very small positive investment difference - use conservative ROI calculation
-            # This prevents mathematical explosion from tiny denominators
-            roi = min(
-                50.0, (annual_savings / 10000) * 100
-            )  # Conservative scaling
-        else:
-            roi = 0.0
-
-        # Equilibrium price calculation
-        if annual_savings > 0:
-            equilibrium_price = calculate_equilibrium_price(
-                annual_savings,
-                financial_metrics[name]["initial_investment"],
-                analysis_years,
-                real_discount_rate,
-            )
-        else:
-            equilibrium_price = None
+# Opportunity cost as NPV of additional annual costs vs the winner
+annual_cost_diff = total_annual_costs - winner_cost
+opp_cost_arr = np.where(
+    annual_cost_diff > 0, annual_cost_diff * disc_factor, 0.0
+)
 
-    # Store enhanced financial metrics
+# Least efficient aerator is the reference point
+irr_arr[is_baseline] = 0.0
+npv_arr[is_baseline] = 0.0
+pay_arr[is_baseline] = 0.0
+pi_arr[is_baseline] = 1.0
+roi_arr[is_baseline] = 0.0
+eq_price_arr[is_baseline] = prices[is_baseline]
+opp_cost_arr[is_baseline] = 0.0
+
+# Store enhanced financial metrics
+for i, name in enumerate(aerator_names):
     financial_metrics[name].update(
         {
-            "npv": npv,
-            "irr": irr,
-            "payback_period": payback,
-            "sotr_ratio": sotr_ratio,
-            "profitability_index": profitability_index,
-            "roi": roi,
-            "equilibrium_price": equilibrium_price,
+            "npv": float(npv_arr[i]),
+            "irr": float(irr_arr[i]),
+            "payback_period": (
+                None if np.isnan(pay_arr[i]) else float(pay_arr[i])
+            ),
+            "sotr_ratio": float(sotr_ratio[i]),
+            "profitability_index": float(pi_arr[i]),
+            "roi": float(roi_arr[i]),
+            "equilibrium_price": (
+                None if np.isnan(eq_price_arr[i]) else float(eq_price_arr[i])
+            ),
+            "opportunity_cost": float(opp_cost_arr[i]),
+            "investment_diff_vs_baseline": float(inv_diff[i]),
         }
     )
 
-    # Calculate opportunity cost - if this aerator costs more to operate than the winner
-    if name == least_efficient_name:
-        # Baseline has no opportunity cost by definition
-        financial_metrics[name]["opportunity_cost"] = 0.0
-    else:
-        # Calculate opportunity cost as NPV of additional costs vs the winner
-        annual_cost_diff = (
-            financial_metrics[name]["total_annual_cost"]
-            - financial_metrics[winner_name]["total_annual_cost"]
-            if winner_name in financial_metrics
-            else 0.0
-        )
-        if annual_cost_diff > 0:
-            # This aerator costs more to operate than the winner
-            opportunity_cost = calculate_npv(
-                0,  # No initial investment difference for opportunity cost
-                annual_cost_diff,  # Annual cost penalty
-                analysis_years,
-                real_discount_rate,
-            )
-        else:
-            # This aerator costs less than or equal to winner
-            opportunity_cost = 0.0
-        financial_metrics[name]["opportunity_cost"] = opportunity_cost
-
 # Debug: Print key metrics for verification
 print("\n=== AERATOR COMPARISON DEBUG ===")
 print(f"Least Efficient Aerator: {least_efficient_name}")
@@ -654,11 +548,6 @@ print("\nKey Metrics Comparison:")
 for name in aerator_names:
     specs = aerator_specs[name]
     metrics = financial_metrics[name]
-    # Calculate the investment diff manually for debugging
-    inv_diff = (
-        metrics["initial_investment"]
-        - financial_metrics[least_efficient_name]["initial_investment"]
-    )
     print(f"\n{name}:")
     print(
         f"  Price: ${specs['price']:,}, Power: {specs['power_hp']} HP, SOTR: {specs['sotr']}"
@@ -667,7 +556,9 @@ for name in aerator_names:
     print(
         f"  Annual Savings vs Least Efficient: ${metrics['annual_savings_vs_baseline']:,.0f}"
     )
-    print(f"  Investment Diff vs Least Efficient: ${inv_diff:,.0f}")
+    print(
+        f"  Investment Diff vs Least Efficient: ${metrics['investment_diff_vs_baseline']:,.0f}"
+    )
     print(f"  SOTR Ratio: {metrics['sotr_ratio']:.2f}")
     print(f"  IRR: {metrics['irr'] * 100:.1f}%, ROI: {metrics['roi']:.1f}%")
     print(f"  Profitability Index: {metrics['profitability_index']:.2f}")
@@ -678,40 +569,127 @@ print("=" * 40)
 # ======================================================================================
 
 # Create a custom red-to-green palette with better gradient transition
-colors = sns.color_palette("RdYlGn", n_colors=len(aerator_names))
+colors = tuple(sns.color_palette("RdYlGn", n_colors=len(aerator_names)))
+
+# Cost category palette (desaturated like seaborn bars), sampled once
+COST_PALETTE = tuple(sns.color_palette("Spectral", 9, desat=0.75))
+
+# Columnar view of the financial metrics, built once for all plots
+metrics_df = pd.DataFrame.from_dict(financial_metrics, orient="index").loc[
+    aerator_names
+]
+
+
+# Shared annotation styles (matplotlib copies these, so one instance is safe)
+_BBOX_LIGHTBLUE = dict(boxstyle="round", facecolor="lightblue", alpha=0.3)
+_ARROW = dict(arrowstyle="->", color="black", alpha=0.5)
+
+# Manual annotation positions (price, value) per aerator with improved layout
+MANUAL_POSITIONS_PRICE_SOTR = np.array(
+    [
+        [620, 2.0],  # Aerator 1
+        [800, 3.5],  # Aerator 2
+        [900, 3.0],  # Aerator 3
+        [1000, 3.5],  # Aerator 4
+        [1160, 3.4],  # Aerator 5
+    ]
+)
+MANUAL_POSITIONS_QUANTITY = np.array(
+    [
+        [650, 2800],  # Aerator 1
+        [800, 1600],  # Aerator 2
+        [900, 1200],  # Aerator 3
+        [1000, 1550],  # Aerator 4
+        [1160, 1450],  # Aerator 5
+    ]
+)
+# IRR ranking positions: (price, multiple of the highest ranking value)
+MANUAL_POSITIONS_IRR = np.array(
+    [
+        [620, 0.5],  # Aerator 1
+        [780, 1.05],  # Aerator 2 - highest for baseline
+        [900, 1.05],  # Aerator 3
+        [1020, 1.01],  # Aerator 4
+        [1170, 0.8],  # Aerator 5 - lowest
+    ]
+)
+
+# Shared evaluation grid for trend lines along the purchase price axis
+X_SMOOTH = np.linspace(prices.min(), prices.max(), 100)
+X_SMOOTH.setflags(write=False)
 
 
 def create_smooth_curve(x, y):
     """
-    Create a smooth curve from x, y data points using spline interpolation.
-    Returns smoothed x and y arrays, or None if interpolation fails.
+    Create a smooth curve from x, y data points using PCHIP interpolation.
+    Returns smoothed x and y arrays, or None for degenerate inputs
+    (empty, mismatched lengths, non-finite values or duplicate x).
+    Results are cached per input so repeated plot calls reuse the spline.
     """
-    try:
-        # Sort the data based on x values
-        sorted_indices = np.argsort(x)
-        x_sorted = np.array([x[i] for i in sorted_indices])
-        y_sorted = np.array([y[i] for i in sorted_indices])
-
-        # Check if we have enough points for interpolation
-        if (
-            len(x) < 4
-        ):  # BSpline requires at least k+1 points (where k=3 for cubic)
-            # Simple linear interpolation for few points
-            x_smooth = np.linspace(min(x_sorted), max(x_sorted), 100)
-            y_smooth = np.interp(x_smooth, x_sorted, y_sorted)
-        else:
-            # Create a B-spline representation of the curve
-            x_smooth = np.linspace(min(x_sorted), max(x_sorted), 100)
-            spl = make_interp_spline(
-                x_sorted, y_sorted, k=3
-            )  # k=3 means cubic spline
-            y_smooth = spl(x_smooth)
-
-        return x_smooth, y_smooth
-    except Exception as e:
-        print(f"Error creating smooth curve: {e}")
+    return _create_smooth_curve_cached(tuple(x), tuple(y))
+
+
+@lru_cache(maxsize=None)
+def _create_smooth_curve_cached(x, y):
+    """Build (and cache) the smoothed curve for hashable x, y tuples."""
+    x_arr = np.asarray(x, dtype=float)
+    y_arr = np.asarray(y, dtype=float)
+
+    # Degenerate inputs cannot be interpolated
+    if x_arr.size == 0 or x_arr.size != y_arr.size:
         return None, None
 
+    # Sort the data based on x values with a single vectorized gather
+    sorted_indices = np.argsort(x_arr)
+    x_sorted = x_arr[sorted_indices]
+    y_sorted = y_arr[sorted_indices]
+    if not (np.isfinite(x_sorted).all() and np.isfinite(y_sorted).all()):
+        return None, None
+    if np.unique(x_sorted).size != x_sorted.size:
+        return None, None
+
+    # Reuse the shared price grid when the x range matches it
+    if x_sorted[0] == X_SMOOTH[0] and x_sorted[-1] == X_SMOOTH[-1]:
+        x_smooth = X_SMOOTH
+    else:
+        x_smooth = np.linspace(x_sorted[0], x_sorted[-1], 100)
+
+    # Check if we have enough points for interpolation
+    if len(x) < 2:  # PCHIP requires at least 2 points
+        # Simple linear interpolation for few points
+        y_smooth = np.interp(x_smooth, x_sorted, y_sorted)
+    else:
+        # Monotonic cubic (PCHIP) avoids overshoot between sparse points
+        spl = PchipInterpolator(x_sorted, y_sorted)
+        y_smooth = spl(x_smooth)
+
+    # Cached arrays are shared between callers
+    y_smooth.setflags(write=False)
+    return x_smooth, y_smooth
+
+
+def create_segment_fills(x, y, facecolors, alpha=0.5):
+    """
+    Build a single PolyCollection filling the area under each data segment.
+    Segment i spans from the previous point (the origin for the first one)
+    to point i, so the top edge follows the data curve.
+    """
+    x_arr = np.asarray(x, dtype=float)
+    y_arr = np.asarray(y, dtype=float)
+    x_prev = np.concatenate([[0], x_arr[:-1]])
+    y_prev = np.concatenate([[0], y_arr[:-1]])
+    zeros = np.zeros_like(x_arr)
+    verts = np.stack(
+        [
+            np.column_stack([x_prev, zeros]),
+            np.column_stack([x_arr, zeros]),
+            np.column_stack([x_arr, y_arr]),
+            np.column_stack([x_prev, y_prev]),
+        ],
+        axis=1,
+    )
+    return PolyCollection(verts, color=facecolors, alpha=alpha)
+
 
 def plot_price_vs_sotr():
     """Create scatter plot of aerator price vs SOTR performance."""
@@ -719,11 +697,12 @@ def plot_price_vs_sotr():
     fig.patch.set_facecolor("whitesmoke")
 
     # Create scatter plot with custom colors and styling
-    ax = sns.scatterplot(
+    sns.scatterplot(
         x=prices,
         y=sotr_values,
         s=300,  # Increased point size for consistency
         hue=aerator_names,
+        ax=ax,
         palette="Spectral",
         edgecolor="black",
         linewidth=2,
@@ -739,49 +718,23 @@ def plot_price_vs_sotr():
         )
 
     # Individual gradient fill for each aerator segment
-    for i, name in enumerate(aerator_names):
-        # Instead of rectangular segments, make them follow the efficiency curve
-        if i == 0:
-            x_fill = [0, prices[i], prices[i], 0]
-            y_fill = [0, 0, sotr_values[i], 0]  # Changed last value to 0
-        else:
-            x_fill = [prices[i - 1], prices[i], prices[i], prices[i - 1]]
-            y_fill = [
-                0,
-                0,
-                sotr_values[i],
-                sotr_values[i - 1],
-            ]  # Follow the curve better
-
-        ax.fill(
-            x_fill, y_fill, color=colors[i], alpha=0.5, label=f"{name} Area"
-        )
-
-    # Manual annotation positioning with improved layout
-    manual_positions = [
-        (620, 2.0),  # Aerator 1
-        (800, 3.5),  # Aerator 2
-        (900, 3.0),  # Aerator 3
-        (1000, 3.5),  # Aerator 4
-        (1160, 3.4),  # Aerator 5
-    ]
+    ax.add_collection(create_segment_fills(prices, sotr_values, colors))
 
     # Add informative annotations for each aerator with slope and integral data
-    for i, (price, sotr, name) in enumerate(
-        zip(prices, sotr_values, aerator_names)
-    ):
-        # Use manual positions
-        ann_x, ann_y = manual_positions[i]
-
+    labels = [
+        f"{name}\n${price}\n{ratio:.4f} SOTR/$"
+        for name, price, ratio in zip(aerator_names, prices, sotr_per_dollar)
+    ]
+    for i, (price, sotr, label) in enumerate(zip(prices, sotr_values, labels)):
         # Single merged annotation with all information
         ax.annotate(
-            f"{name}\n${price}\n{sotr_per_dollar[i]:.4f} SOTR/$",
+            label,
             xy=(price, sotr),
-            xytext=(ann_x, ann_y),
+            xytext=MANUAL_POSITIONS_PRICE_SOTR[i],
             fontsize=10,
             ha="center",
-            bbox=dict(boxstyle="round", facecolor="lightblue", alpha=0.3),
-            arrowprops=dict(arrowstyle="->", color="black", alpha=0.5),
+            bbox=_BBOX_LIGHTBLUE,
+            arrowprops=_ARROW,
         )
 
     # Customize plot appearance
@@ -802,28 +755,22 @@ def plot_price_vs_sotr():
     return fig, ax
 
 
-# Generate plots
-fig, ax = plot_price_vs_sotr()
-plt.show()
-
-
 def plot_aerator_quantity():
     """Plot aerator quantity requirements with logarithmic scaling for marginal effects."""
     fig, ax = plt.subplots(figsize=(18, 10))
 
     # Get data
-    aerator_counts = [
-        financial_metrics[name]["num_aerators"] for name in aerator_names
-    ]
+    aerator_counts = metrics_df["num_aerators"].to_numpy()
 
     fig.patch.set_facecolor("whitesmoke")
 
     # Plot Price vs Aerator Quantity (log scale for marginal effects)
-    ax = sns.scatterplot(
+    sns.scatterplot(
         x=prices,
         y=aerator_counts,
         s=300,
         hue=aerator_names,
+        ax=ax,
         edgecolors="black",
         linewidth=2,
         alpha=1,
@@ -838,52 +785,28 @@ def plot_aerator_quantity():
         )
 
     # Gradient fill for each aerator with red-to-green progression following natural curve
-    for i, name in enumerate(aerator_names):
-        if i == 0:
-            # First aerator: fill from start to first point
-            x_fill = [0] + [prices[i]]
-            y_fill = [0] + [aerator_counts[i]]
-        else:
-            # Subsequent aerators: fill between previous point and current point
-            x_fill = [prices[i - 1]] + [prices[i]]
-            y_fill = [aerator_counts[i - 1]] + [aerator_counts[i]]
-
-        ax.fill_between(
-            x_fill,
-            y_fill,
-            color=colors[i],
-            alpha=0.5,  # Increased alpha since segments won't overlap
-            label=f"{name} Area",
-        )
+    ax.add_collection(create_segment_fills(prices, aerator_counts, colors))
 
     # Set logarithmic scale for y-axis to capture marginal effects
     ax.set_yscale("log")
 
-    # Manual annotation positioning with improved layout
-    manual_positions = [
-        (650, 2800),  # Aerator 1
-        (800, 1600),  # Aerator 2
-        (900, 1200),  # Aerator 3
-        (1000, 1550),  # Aerator 4
-        (1160, 1450),  # Aerator 5
-    ]
-
     # Annotate each point with single merged annotation box containing all info
-    for i, (price, count, name) in enumerate(
-        zip(prices, aerator_counts, aerator_names)
+    labels = [
+        f"{name}\n{count:,} units\n${price}"
+        for name, count, price in zip(aerator_names, aerator_counts, prices)
+    ]
+    for i, (price, count, label) in enumerate(
+        zip(prices, aerator_counts, labels)
     ):
-        # Use manual positions
-        ann_x, ann_y = manual_positions[i]
-
         # Single merged annotation with all information
         ax.annotate(
-            f"{name}\n{count:,} units\n${price}",
+            label,
             xy=(price, count),
-            xytext=(ann_x, ann_y),
+            xytext=MANUAL_POSITIONS_QUANTITY[i],
             fontsize=10,
             ha="center",
             bbox=dict(boxstyle="round", facecolor=colors[i], alpha=0.3),
-            arrowprops=dict(arrowstyle="->", color="black", alpha=0.5),
+            arrowprops=_ARROW,
         )
 
     ax.set_xlabel("Purchase Price ($)", fontsize=12)
@@ -907,105 +830,75 @@ def plot_aerator_quantity():
     return fig, ax
 
 
-fig, ax = plot_aerator_quantity()
-plt.show()
-
-
 def plot_annual_costs_breakdown():
     """Plot annual operating costs breakdown with enhanced styling and analysis."""
     fig, ax = plt.subplots(figsize=(18, 10))
 
     # Get cost data
-    energy_costs = [
-        financial_metrics[name]["annual_energy_cost"] for name in aerator_names
-    ]
-    maintenance_costs = [
-        financial_metrics[name]["annual_maintenance_cost"]
-        for name in aerator_names
-    ]
-    replacement_costs = [
-        financial_metrics[name]["annual_replacement_cost"]
-        for name in aerator_names
-    ]
-    total_costs = [
-        financial_metrics[name]["total_annual_cost"] for name in aerator_names
-    ]
+    energy_costs = metrics_df["annual_energy_cost"].to_numpy()
+    maintenance_costs = metrics_df["annual_maintenance_cost"].to_numpy()
+    replacement_costs = metrics_df["annual_replacement_cost"].to_numpy()
+    total_costs = metrics_df["total_annual_cost"].to_numpy()
 
     # Create stacked bar chart
     width = 0.6
     x_pos = np.arange(len(aerator_names))
 
-    # Convert to millions for display
-    energy_millions = [e / 1e6 for e in energy_costs]
-    maintenance_millions = [m / 1e6 for m in maintenance_costs]
-    replacement_millions = [r / 1e6 for r in replacement_costs]
+    # Convert to millions for display and stack the segments once:
+    # each segment sits on the running total of the ones below it
+    segments = (
+        np.vstack([energy_costs, maintenance_costs, replacement_costs]) / 1e6
+    )
+    energy_millions, maintenance_millions, replacement_millions = segments
+    bottoms = np.zeros_like(segments)
+    np.cumsum(segments[:-1], axis=0, out=bottoms[1:])
+    centers = bottoms + segments / 2
 
     # Create stacked bars with different patterns/colors for each cost type
-    # Define a color palette for cost categories
-    cost_palette = sns.color_palette("Spectral", 9)
-
-    ax = sns.barplot(
-        x=x_pos,
-        y=energy_millions,
+    ax.bar(
+        x_pos,
+        energy_millions,
+        width,
         label="Energy Cost",
-        color=cost_palette[0],  # First color from palette for energy
+        color=COST_PALETTE[0],  # First color from palette for energy
         alpha=0.8,
         edgecolor="black",
         linewidth=1,
-        width=width,
     )
 
-    ax = sns.barplot(
-        x=x_pos,
-        y=maintenance_millions,
-        bottom=energy_millions,
+    ax.bar(
+        x_pos,
+        maintenance_millions,
+        width,
+        bottom=bottoms[1],
         label="Maintenance Cost",
-        color=cost_palette[4],  # Second color for maintenance
+        color=COST_PALETTE[4],  # Second color for maintenance
         alpha=0.8,
         edgecolor="black",
         linewidth=1,
-        width=width,
     )
 
-    ax = sns.barplot(
-        x=x_pos,
-        y=replacement_millions,
-        bottom=[e + m for e, m in zip(energy_millions, maintenance_millions)],
+    ax.bar(
+        x_pos,
+        replacement_millions,
+        width,
+        bottom=bottoms[2],
         label="Replacement Cost",
-        color=cost_palette[8],  # Third color for replacement
+        color=COST_PALETTE[8],  # Third color for replacement
         alpha=0.8,
         edgecolor="black",
         linewidth=1,
-        width=width,
     )
-    # Add value labels on each stack segment
-    for i, name in enumerate(aerator_names):
-        # Energy cost label - position in the middle of the energy segment
-        if (
-            energy_millions[i] > 0.05
-        ):  # Only show label if segment is large enough
-            ax.text(
-                i,
-                energy_millions[i] / 2,  # Center of the energy segment
-                f"${energy_millions[i]:.2f}M",
-                ha="center",
-                va="center",  # Changed from "bottom" to "center"
-                fontweight="bold",
-                fontsize=9,
-                color="black",
-            )
 
-        # Maintenance cost label - position in the middle of the maintenance segment
-        if (
-            maintenance_millions[i] > 0.05
-        ):  # Only show label if segment is large enough
+    # Add value labels in the middle of each stack segment
+    for values, value_centers in zip(segments, centers):
+        labels = [f"${v:.2f}M" for v in values]
+        # Only show label if segment is large enough
+        for i in np.flatnonzero(values > 0.05):
             ax.text(
                 i,
-                energy_millions[i]
-                + (
-                    maintenance_millions[i] / 2
-                ),  # Center of maintenance segment
-                f"${maintenance_millions[i]:.2f}M",
+                value_centers[i],
+                labels[i],
                 ha="center",
                 va="center",
                 fontweight="bold",
@@ -1013,31 +906,16 @@ def plot_annual_costs_breakdown():
                 color="black",
             )
 
-        # Replacement cost label - position in the middle of the replacement segment
-        if (
-            replacement_millions[i] > 0.05
-        ):  # Only show label if segment is large enough
-            ax.text(
-                i,
-                energy_millions[i]
-                + maintenance_millions[i]
-                + (
-                    replacement_millions[i] / 2
-                ),  # Center of replacement segment
-                f"${replacement_millions[i]:.2f}M",
-                ha="center",
-                va="center",
-                fontweight="bold",
-                fontsize=9,
-                color="black",
-            )
-
-        # Total cost label above each bar
-        total_million = total_costs[i] / 1e6
+    # Total cost label above each bar
+    total_millions = total_costs / 1e6
+    total_labels = [f"Total: ${v:.2f}M" for v in total_millions]
+    for i, (total_million, label) in enumerate(
+        zip(total_millions, total_labels)
+    ):
         ax.text(
             i,
             total_million + 0.1,
-            f"Total: ${total_million:.2f}M",
+            label,
             ha="center",
             va="center",
             fontweight="bold",
@@ -1058,6 +936,8 @@ def plot_annual_costs_breakdown():
     ax.set_xlabel("")
     ax.set_xticks(x_pos)
     ax.set_xticklabels(aerator_names, rotation=0)
+    ax.set_xlim(-0.5, len(aerator_names) - 0.5)
+    ax.xaxis.grid(False)
     ax.yaxis.set_major_formatter(NullFormatter())
     ax.yaxis.set_minor_formatter(NullFormatter())
     ax.spines["top"].set_visible(False)
@@ -1074,8 +954,18 @@ def plot_annual_costs_breakdown():
     return fig, ax
 
 
-fig, ax = plot_annual_costs_breakdown()
-plt.show()
+def _compute_ranks(savings, least_idx, base_rank=1.0):
+    """Rank aerators by cost savings relative to the least efficient one."""
+    # Positive savings (better than least efficient) - higher rank, scaled
+    # by 10 per $1M; no savings (same as least efficient) - same rank
+    out = np.where(
+        savings > 0, base_rank + (savings / 1000000) * 10, base_rank
+    )
+    out[least_idx] = base_rank
+
+    # Shift all values up (never down) so the minimum ranking is at least 1
+    out += max(0.0, 1.0 - out.min())
+    return out
 
 
 def plot_irr_analysis():
@@ -1083,59 +973,35 @@ def plot_irr_analysis():
     fig, ax = plt.subplots(figsize=(18, 10))
 
     # Calculate cost differences from least efficient (positive means better than least efficient)
-    cost_differences = []
-    irr_values = []
-
-    for name in aerator_names:
-        if name == least_efficient_name:
-            cost_differences.append(0.0)  # Least efficient is 0 reference
-            irr_values.append(0.0)
-        else:
-            # Cost difference: positive means this aerator saves money vs least efficient
-            cost_diff = financial_metrics[name]["annual_savings_vs_baseline"]
-            cost_differences.append(cost_diff)
-
-            # Get the calculated IRR from financial_metrics
-            irr_val = financial_metrics[name].get("irr", None)
-            if irr_val is None:
-                irr_values.append(0.0)
-            else:
-                # Use actual IRR values, no artificial cap
-                irr_values.append(irr_val * 100)  # Convert to percentage
+    # Least efficient is the 0 reference for both savings and IRR
+    is_least_efficient = metrics_df.index == least_efficient_name
+    cost_differences = np.where(
+        is_least_efficient,
+        0.0,
+        metrics_df["annual_savings_vs_baseline"].to_numpy(),
+    )
+    # Use actual IRR values as percentages, no artificial cap
+    irr_values = np.where(
+        is_least_efficient, 0.0, metrics_df["irr"].fillna(0.0).to_numpy() * 100
+    )
 
     # Create ranking system: best performers get highest rank, least efficient gets lowest
     # We'll rank by cost efficiency (annual savings), with least efficient = 0
     least_efficient_rank = 1  # Least efficient gets the lowest rank
 
-    ranking_values = []
-    for i, name in enumerate(aerator_names):
-        if name == least_efficient_name:
-            ranking_values.append(least_efficient_rank)
-        else:
-            # Rank based on cost savings - higher savings = higher rank
-            savings = cost_differences[i]
-            if savings > 0:
-                # Positive savings (better than least efficient) - higher rank
-                ranking_values.append(
-                    least_efficient_rank + (savings / 1000000) * 10
-                )  # Scale factor
-            else:
-                # No savings (same as least efficient) - same rank
-                ranking_values.append(least_efficient_rank)
-
-    # Ensure minimum ranking value for display
-    min_ranking = min(ranking_values)
-    if min_ranking < 1:
-        # Shift all values up to ensure positive ranking
-        shift = 1 - min_ranking
-        ranking_values = [r + shift for r in ranking_values]
+    ranking_values = _compute_ranks(
+        cost_differences.astype(np.float64),
+        aerator_names.index(least_efficient_name),
+        float(least_efficient_rank),
+    )
 
     # Create scatter plot with custom colors and styling
-    ax = sns.scatterplot(
+    sns.scatterplot(
         x=prices,
         y=ranking_values,
         s=300,
         hue=aerator_names,
+        ax=ax,
         edgecolors="black",
         linewidth=2,
         alpha=1,
@@ -1143,30 +1009,10 @@ def plot_irr_analysis():
     )
 
     # Gradient fill for each aerator
-    for i, name in enumerate(aerator_names):
-        if i == 0:
-            x_fill = [0] + [prices[i]]
-            y_fill = [0] + [ranking_values[i]]
-        else:
-            x_fill = [prices[i - 1]] + [prices[i]]
-            y_fill = [ranking_values[i - 1]] + [ranking_values[i]]
-
-        ax.fill_between(
-            x_fill,
-            y_fill,
-            color=colors[i],
-            alpha=0.5,
-            label=f"{name} Area",
-        )
+    ax.add_collection(create_segment_fills(prices, ranking_values, colors))
 
     # Manual annotation positioning adjusted for ranking values
-    manual_positions = [
-        (620, max(ranking_values) * 0.5),  # Aerator 1
-        (780, max(ranking_values) * 1.05),  # Aerator 2 - highest for baseline
-        (900, max(ranking_values) * 1.05),  # Aerator 3
-        (1020, max(ranking_values) * 1.01),  # Aerator 4
-        (1170, max(ranking_values) * 0.8),  # Aerator 5 - lowest
-    ]
+    manual_positions = MANUAL_POSITIONS_IRR * [1, max(ranking_values)]
 
     # Add informative annotations for each aerator
     for i, (price, ranking_val, name) in enumerate(
@@ -1201,7 +1047,7 @@ def plot_irr_analysis():
             fontsize=10,
             ha="center",
             bbox=dict(boxstyle="round", facecolor=colors[i], alpha=0.7),
-            arrowprops=dict(arrowstyle="->", color="black", alpha=0.5),
+            arrowprops=_ARROW,
         )
 
     ax.set_title(
@@ -1229,7 +1075,17 @@ def plot_irr_analysis():
     return fig, ax
 
 
-fig, ax = plot_irr_analysis()
+# Generate plots: build every figure first, then render them in one pass
+with plt.ioff():
+    figures = [
+        plot()
+        for plot in (
+            plot_price_vs_sotr,
+            plot_aerator_quantity,
+            plot_annual_costs_breakdown,
+            plot_irr_analysis,
+        )
+    ]
 plt.show()
 
 
@@ -1253,13 +1109,13 @@ plt.show()
 
 # Display summary table
 
-df_summary = pd.DataFrame()
+summary_data = {}
 for name in aerator_names:
     perf = performance_data[name]
     fin = financial_metrics[name]
     specs = aerator_specs[name]
 
-    df_summary[name] = [
+    summary_data[name] = [
         f"${specs['price']:,}",
         f"{specs['power_hp']} HP",
         f"{specs['sotr']:.1f}",
@@ -1274,27 +1130,34 @@ for name in aerator_names:
         f"${fin['annual_savings_vs_baseline']:,.0f}",  # Changed from "annual_savings_vs_efficient"
     ]
 
-df_summary.index = [
-    "Unit Price",
-    "Power Rating",
-    "SOTR (kg O2/hr)",
-    "OTRT (kg O2/hr)",
-    "Units Needed",
-    "Initial Investment",
-    "Annual Energy Cost",
-    "Annual Maintenance",
-    "Total Annual Cost",
-    "Cost per kg O2",
-    "Energy per kg O2",
-    "Annual Savings vs Least Efficient",  # Updated label
-]
+df_summary = pd.DataFrame(
+    summary_data,
+    index=[
+        "Unit Price",
+        "Power Rating",
+        "SOTR (kg O2/hr)",
+        "OTRT (kg O2/hr)",
+        "Units Needed",
+        "Initial Investment",
+        "Annual Energy Cost",
+        "Annual Maintenance",
+        "Total Annual Cost",
+        "Cost per kg O2",
+        "Energy per kg O2",
+        "Annual Savings vs Least Efficient",  # Updated label
+    ],
+)
 
-# Display as HTML
-display(HTML("<h3>Performance and Cost Analysis Summary</h3>"))
-display(HTML(df_summary.to_html(escape=False, table_id="summary_table")))
+# Display heading and table as a single HTML output
+display(
+    HTML(
+        "<h3>Performance and Cost Analysis Summary</h3>"
+        + df_summary.to_html(escape=False, table_id="summary_table")
+    )
+)
 
 # Create enhanced financial summary
-df_financial = pd.DataFrame()
+financial_data = {}
 for name in aerator_names:
     fin = financial_metrics[name]
 
@@ -1322,7 +1185,7 @@ for name in aerator_names:
 
     roi_display = f"{fin['roi']:.1f}%" if fin["roi"] is not None else "0.0%"
 
-    df_financial[name] = [
+    financial_data[name] = [
         f"${fin['initial_investment']:,.2f}",
         f"${fin['annual_savings_vs_baseline']:,.0f}",
         npv_display,
@@ -1338,73 +1201,41 @@ for name in aerator_names:
         ),
     ]
 
-df_financial.index = [
-    "Initial Investment",
-    "Annual Savings vs Least Efficient",
-    "Net Present Value",
-    "Internal Rate of Return",
-    "Payback Period",
-    "SOTR Performance Ratio",
-    "Profitability Index",
-    "Return on Investment",
-    "Opportunity Cost (NPV)",
-]
-
-# Display as HTML
-display(HTML("<h3>Enhanced Financial Analysis</h3>"))
-display(HTML(df_financial.to_html(escape=False, table_id="financial_table")))
-
-
-# Find best options for different criteria
-best_initial_cost = min(
-    aerator_names, key=lambda x: financial_metrics[x]["initial_investment"]
-)
-best_operating_cost = min(
-    aerator_names, key=lambda x: financial_metrics[x]["total_annual_cost"]
-)
-best_npv = max(
-    [
-        name
-        for name in aerator_names
-        if financial_metrics[name]["npv"] is not None
-    ],
-    key=lambda x: financial_metrics[x]["npv"],
-)
-best_irr = max(
-    [
-        name
-        for name in aerator_names
-        if financial_metrics[name]["irr"] is not None
+df_financial = pd.DataFrame(
+    financial_data,
+    index=[
+        "Initial Investment",
+        "Annual Savings vs Least Efficient",
+        "Net Present Value",
+        "Internal Rate of Return",
+        "Payback Period",
+        "SOTR Performance Ratio",
+        "Profitability Index",
+        "Return on Investment",
+        "Opportunity Cost (NPV)",
     ],
-    key=lambda x: financial_metrics[x]["irr"],
 )
-best_profitability_index = max(
-    [
-        name
-        for name in aerator_names
-        if financial_metrics[name]["profitability_index"] is not None
-    ],
-    key=lambda x: financial_metrics[x]["profitability_index"],
-)
-best_roi = max(
-    [
-        name
-        for name in aerator_names
-        if financial_metrics[name]["roi"] is not None
-    ],
-    key=lambda x: financial_metrics[x]["roi"],
-)
-best_payback_period = min(
-    [
-        name
-        for name in aerator_names
-        if financial_metrics[name]["payback_period"] is not None
-    ],
-    key=lambda x: financial_metrics[x]["payback_period"],
+
+# Display heading and table as a single HTML output
+display(
+    HTML(
+        "<h3>Enhanced Financial Analysis</h3>"
+        + df_financial.to_html(escape=False, table_id="financial_table")
+    )
 )
 
+
+# Find best options for different criteria (NaN entries are skipped)
+best_initial_cost = metrics_df["initial_investment"].idxmin()
+best_operating_cost = metrics_df["total_annual_cost"].idxmin()
+best_npv = metrics_df["npv"].idxmax()
+best_irr = metrics_df["irr"].idxmax()
+best_profitability_index = metrics_df["profitability_index"].idxmax()
+best_roi = metrics_df["roi"].idxmax()
+best_payback_period = metrics_df["payback_period"].idxmin()
+
 # Create HTML table for better visualization
-business_insights_html = f"""
+BUSINESS_INSIGHTS_TMPL = Template("""
 <div style="background-color: #f8f9fa; padding: 20px; border-radius: 10px; margin-top: 20px;">
     <h3 style="color: #2c3e50; margin-bottom: 20px;">🏆 Best Options Summary</h3>
     <table style="width: 100%; border-collapse: collapse; margin-bottom: 20px;">
@@ -1414,58 +1245,77 @@ business_insights_html = f"""
         </tr>
         <tr>
             <td style="padding: 10px; border: 1px solid #dee2e6;">🏆 Best Initial Cost</td>
-            <td style="padding: 10px; border: 1px solid #dee2e6; font-weight: bold;">{best_initial_cost}</td>
+            <td style="padding: 10px; border: 1px solid #dee2e6; font-weight: bold;">${best_initial_cost}</td>
         </tr>
         <tr style="background-color: #f8f9fa;">
             <td style="padding: 10px; border: 1px solid #dee2e6;">💰 Best Operating Cost</td>
-            <td style="padding: 10px; border: 1px solid #dee2e6; font-weight: bold; color: #28a745;">{best_operating_cost}</td>
+            <td style="padding: 10px; border: 1px solid #dee2e6; font-weight: bold; color: #28a745;">${best_operating_cost}</td>
         </tr>
         <tr>
             <td style="padding: 10px; border: 1px solid #dee2e6;">📈 Best NPV</td>
-            <td style="padding: 10px; border: 1px solid #dee2e6; font-weight: bold; color: #28a745;">{best_npv}</td>
+            <td style="padding: 10px; border: 1px solid #dee2e6; font-weight: bold; color: #28a745;">${best_npv}</td>
         </tr>
         <tr style="background-color: #f8f9fa;">
             <td style="padding: 10px; border: 1px solid #dee2e6;">🚀 Best IRR</td>
-            <td style="padding: 10px; border: 1px solid #dee2e6; font-weight: bold; color: #28a745;">{best_irr}</td>
+            <td style="padding: 10px; border: 1px solid #dee2e6; font-weight: bold; color: #28a745;">${best_irr}</td>
         </tr>
         <tr>
             <td style="padding: 10px; border: 1px solid #dee2e6;">📊 Best Profitability Index</td>
-            <td style="padding: 10px; border: 1px solid #dee2e6; font-weight: bold; color: #28a745;">{best_profitability_index}</td>
+            <td style="padding: 10px; border: 1px solid #dee2e6; font-weight: bold; color: #28a745;">${best_profitability_index}</td>
         </tr>
         <tr style="background-color: #f8f9fa;">
             <td style="padding: 10px; border: 1px solid #dee2e6;">📈 Best ROI</td>
-            <td style="padding: 10px; border: 1px solid #dee2e6; font-weight: bold; color: #28a745;">{best_roi}</td>
+            <td style="padding: 10px; border: 1px solid #dee2e6; font-weight: bold; color: #28a745;">${best_roi}</td>
         </tr>
         <tr>
             <td style="padding: 10px; border: 1px solid #dee2e6;">⏳ Best Payback Period</td>
-            <td style="padding: 10px; border: 1px solid #dee2e6; font-weight: bold; color: #28a745;">{best_payback_period}</td>
+            <td style="padding: 10px; border: 1px solid #dee2e6; font-weight: bold; color: #28a745;">${best_payback_period}</td>
         </tr>
         <tr style="background-color: #fff3cd;">
             <td style="padding: 10px; border: 1px solid #dee2e6;">⭐ Winner (Most Efficient)</td>
-            <td style="padding: 10px; border: 1px solid #dee2e6; font-weight: bold; color: #856404;">{winner_name}</td>
+            <td style="padding: 10px; border: 1px solid #dee2e6; font-weight: bold; color: #856404;">${winner_name}</td>
         </tr>
     </table>
     
     <h3 style="color: #2c3e50; margin-bottom: 15px;">📊 Key Business Insights</h3>
     <ul style="list-style-type: none; padding-left: 0;">
         <li style="margin-bottom: 10px; padding: 8px; background-color: #e7f3ff; border-left: 4px solid #007bff; border-radius: 4px;">
-            🎯 <strong>Total Oxygen Demand:</strong> {total_oxygen_demand:,.1f} kg/day
+            🎯 <strong>Total Oxygen Demand:</strong> ${total_oxygen_demand} kg/day
         </li>
         <li style="margin-bottom: 10px; padding: 8px; background-color: #e8f5e8; border-left: 4px solid #28a745; border-radius: 4px;">
-            🦐 <strong>Annual Shrimp Production:</strong> {annual_shrimp_production:,.0f} kg
+            🦐 <strong>Annual Shrimp Production:</strong> ${annual_shrimp_production} kg
         </li>
         <li style="margin-bottom: 10px; padding: 8px; background-color: #fff3cd; border-left: 4px solid #ffc107; border-radius: 4px;">
-            ⏰ <strong>Operation Schedule:</strong> {daily_operation_hours} hours/day, {days_per_year} days/year
+            ⏰ <strong>Operation Schedule:</strong> ${daily_operation_hours} hours/day, ${days_per_year} days/year
         </li>
         <li style="margin-bottom: 10px; padding: 8px; background-color: #f8d7da; border-left: 4px solid #dc3545; border-radius: 4px;">
-            💡 <strong>Key Finding:</strong> {winner_name} provides the best overall value proposition, while choosing {least_efficient_name} results in significant opportunity costs over the analysis period.
+            💡 <strong>Key Finding:</strong> ${winner_name} provides the best overall value proposition, while choosing ${least_efficient_name} results in significant opportunity costs over the analysis period.
         </li>
         <li style="margin-bottom: 10px; padding: 8px; background-color: #d1ecf1; border-left: 4px solid #0c5460; border-radius: 4px;">
-            📈 <strong>Financial Impact:</strong> The opportunity cost of choosing the least efficient option can exceed ${financial_metrics[least_efficient_name]["total_annual_cost"] - financial_metrics[winner_name]["total_annual_cost"]:,.0f} annually.
+            📈 <strong>Financial Impact:</strong> The opportunity cost of choosing the least efficient option can exceed $$${annual_impact} annually.
         </li>
     </ul>
 </div>
-"""
+""")
+
+least_total = financial_metrics[least_efficient_name]["total_annual_cost"]
+winner_total = financial_metrics[winner_name]["total_annual_cost"]
+business_insights_html = BUSINESS_INSIGHTS_TMPL.substitute(
+    best_initial_cost=best_initial_cost,
+    best_operating_cost=best_operating_cost,
+    best_npv=best_npv,
+    best_irr=best_irr,
+    best_profitability_index=best_profitability_index,
+    best_roi=best_roi,
+    best_payback_period=best_payback_period,
+    winner_name=winner_name,
+    least_efficient_name=least_efficient_name,
+    total_oxygen_demand=f"{total_oxygen_demand:,.1f}",
+    annual_shrimp_production=f"{annual_shrimp_production:,.0f}",
+    daily_operation_hours=daily_operation_hours,
+    days_per_year=days_per_year,
+    annual_impact=f"{least_total - winner_total:,.0f}",
+)
 
 display(HTML(business_insights_html))
 
@@ -1473,36 +1323,47 @@ display(HTML(business_insights_html))
 # OPPORTUNITY COST ANALYSIS TABLE
 # ======================================================================================
 
-# Calculate opportunity costs before creating tables
-for name in aerator_names:
-    if name == least_efficient_name:
-        # Baseline has no opportunity cost by definition
-        financial_metrics[name]["opportunity_cost"] = 0.0
-    else:
-        # Calculate opportunity cost as NPV of additional costs vs the winner
-        annual_cost_diff = (
-            financial_metrics[name]["total_annual_cost"]
-            - financial_metrics[winner_name]["total_annual_cost"]
-        )
-        if annual_cost_diff > 0:
-            # This aerator costs more to operate than the winner
-            opportunity_cost = calculate_npv(
-                0,  # No initial investment difference for opportunity cost
-                annual_cost_diff,  # Annual cost penalty
-                analysis_years,
-                real_discount_rate,
-            )
-        else:
-            # This aerator costs less than or equal to winner
-            opportunity_cost = 0.0
-        financial_metrics[name]["opportunity_cost"] = opportunity_cost
+# Annual cost penalty vs the winner (annual_cost_diff) and the stored
+# opportunity costs come from CELL 1; only the table's unclipped NPV column
+# is derived here, using the annuity factor hoisted above (disc_factor)
+npv_cost_diffs = annual_cost_diff * disc_factor
 
-# Create opportunity cost analysis table
-opportunity_cost_html = f"""
+# Investment decision buckets by annual cost penalty vs the winner:
+# <= $0, up to $500K, up to $1M, above $1M; the last entry marks the winner
+_DECISION_THRESHOLDS = np.array([0, 500_000, 1_000_000])
+_DECISION_STR = np.array(
+    [
+        "✅ GOOD ALTERNATIVE",
+        "💡 CONSIDER - Low Cost",
+        "⚠️ CAUTION - Moderate Cost",
+        "❌ AVOID - High Cost",
+        "✅ OPTIMAL CHOICE",
+    ],
+    dtype=object,
+)
+_DECISION_COLOR = np.array(
+    ["#28a745", "#17a2b8", "#ffc107", "#dc3545", "#28a745"], dtype=object
+)
+
+# Whole-dollar money formatter for the table cells
+_FMT_MONEY = "${:,.0f}".format
+
+# Opportunity cost table template, compiled once by Jinja2
+_OPPORTUNITY_COST_FIELDS = (
+    "row_color",
+    "name",
+    "annual_opp_cost",
+    "npv_opp_cost",
+    "efficiency_ratio",
+    "decision_color",
+    "decision",
+)
+OPPORTUNITY_COST_TEMPLATE = jinja2.Template(
+    """
 <div style="margin-top: 30px; padding: 20px; background-color: #f8f9fa; border-radius: 10px;">
     <h2 style="color: #2c3e50; text-align: center; margin-bottom: 20px;">💰 Opportunity Cost Analysis</h2>
     <p style="color: #6c757d; text-align: center; margin-bottom: 25px;">
-        Cost of choosing each aerator instead of the most efficient option ({winner_name})
+        Cost of choosing each aerator instead of the most efficient option ({{ winner_name }})
     </p>
     
     <table style="width: 100%; border-collapse: collapse; background-color: white; border-radius: 8px; overflow: hidden; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
@@ -1516,63 +1377,15 @@ opportunity_cost_html = f"""
             </tr>
         </thead>
         <tbody>
-"""
-
-for i, name in enumerate(aerator_names):
-    if name == winner_name:
-        # Winner aerator
-        row_color = "#d4edda"  # Light green
-        annual_opp_cost = "$0"
-        npv_opp_cost = "$0"
-        decision = "✅ OPTIMAL CHOICE"
-        decision_color = "#28a745"
-    else:
-        # Calculate opportunity cost of choosing this over winner
-        winner_metrics = financial_metrics[winner_name]
-        current_metrics = financial_metrics[name]
-
-        annual_cost_diff = (
-            current_metrics["total_annual_cost"]
-            - winner_metrics["total_annual_cost"]
-        )
-        npv_cost_diff = calculate_npv(
-            0, annual_cost_diff, analysis_years, real_discount_rate
-        )
-
-        row_color = (
-            "#f8d7da" if annual_cost_diff > 0 else "#fff3cd"
-        )  # Light red if costly, yellow if neutral
-        annual_opp_cost = (
-            f"${annual_cost_diff:,.0f}" if annual_cost_diff != 0 else "$0"
-        )
-        npv_opp_cost = f"${npv_cost_diff:,.0f}" if npv_cost_diff != 0 else "$0"
-
-        if annual_cost_diff > 1000000:  # > $1M annually
-            decision = "❌ AVOID - High Cost"
-            decision_color = "#dc3545"
-        elif annual_cost_diff > 500000:  # > $500K annually
-            decision = "⚠️ CAUTION - Moderate Cost"
-            decision_color = "#ffc107"
-        elif annual_cost_diff > 0:
-            decision = "💡 CONSIDER - Low Cost"
-            decision_color = "#17a2b8"
-        else:
-            decision = "✅ GOOD ALTERNATIVE"
-            decision_color = "#28a745"
-
-    efficiency_ratio = financial_metrics[name]["efficiency_ratio"]
-
-    opportunity_cost_html += f"""
-        <tr style="background-color: {row_color};">
-            <td style="padding: 12px; border-bottom: 1px solid #dee2e6; font-weight: bold;">{name}</td>
-            <td style="padding: 12px; border-bottom: 1px solid #dee2e6; text-align: center;">{annual_opp_cost}</td>
-            <td style="padding: 12px; border-bottom: 1px solid #dee2e6; text-align: center;">{npv_opp_cost}</td>
-            <td style="padding: 12px; border-bottom: 1px solid #dee2e6; text-align: center;">{efficiency_ratio:.2f}x</td>
-            <td style="padding: 12px; border-bottom: 1px solid #dee2e6; text-align: center; color: {decision_color}; font-weight: bold;">{decision}</td>
+{% for row in rows %}
+        <tr style="background-color: {{ row.row_color }};">
+            <td style="padding: 12px; border-bottom: 1px solid #dee2e6; font-weight: bold;">{{ row.name }}</td>
+            <td style="padding: 12px; border-bottom: 1px solid #dee2e6; text-align: center;">{{ row.annual_opp_cost }}</td>
+            <td style="padding: 12px; border-bottom: 1px solid #dee2e6; text-align: center;">{{ row.npv_opp_cost }}</td>
+            <td style="padding: 12px; border-bottom: 1px solid #dee2e6; text-align: center;">{{ "%.2f"|format(row.efficiency_ratio) }}x</td>
+            <td style="padding: 12px; border-bottom: 1px solid #dee2e6; text-align: center; color: {{ row.decision_color }}; font-weight: bold;">{{ row.decision }}</td>
         </tr>
-    """
-
-opportunity_cost_html += f"""
+    {% endfor %}
         </tbody>
     </table>
     
@@ -1581,11 +1394,47 @@ opportunity_cost_html += f"""
         <ul style="margin: 0; padding-left: 20px; color: #495057;">
             <li>Opportunity cost represents the financial penalty of not choosing the most efficient option</li>
             <li>Higher efficiency ratios indicate better oxygen transfer performance relative to baseline</li>
-            <li>NPV opportunity cost shows the present value of losses over {analysis_years} years</li>
+            <li>NPV opportunity cost shows the present value of losses over {{ analysis_years }} years</li>
             <li>Investment decisions balance efficiency gains against opportunity costs</li>
         </ul>
     </div>
 </div>
-"""
+""",
+    keep_trailing_newline=True,
+)
+
+# Create opportunity cost analysis table
+# Bucket every annual cost penalty at once; the winner uses the last entry
+decision_idx = np.searchsorted(
+    _DECISION_THRESHOLDS, annual_cost_diff, side="left"
+)
+decision_idx[winner_idx] = -1
+eff_ratio = metrics_df["efficiency_ratio"].to_numpy()
+
+# Format every column up front; the winner's cost differences are exactly 0
+is_costlier = annual_cost_diff > 0
+row_colors = np.where(is_costlier, "#f8d7da", "#fff3cd").astype(object)
+row_colors[winner_idx] = "#d4edda"  # Light green for the winner
+annual_opp_costs = [
+    "$0" if v == 0 else _FMT_MONEY(v) for v in annual_cost_diff
+]
+npv_opp_costs = ["$0" if v == 0 else _FMT_MONEY(v) for v in npv_cost_diffs]
+
+rows = [
+    dict(zip(_OPPORTUNITY_COST_FIELDS, values))
+    for values in zip(
+        row_colors,
+        aerator_names,
+        annual_opp_costs,
+        npv_opp_costs,
+        eff_ratio,
+        _DECISION_COLOR[decision_idx],
+        _DECISION_STR[decision_idx],
+    )
+]
+
+opportunity_cost_html = OPPORTUNITY_COST_TEMPLATE.render(
+    rows=rows, winner_name=winner_name, analysis_years=analysis_years
+)
 
 display(HTML(opportunity_cost_html))
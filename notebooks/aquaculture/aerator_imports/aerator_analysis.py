@@ -18,9 +18,11 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
+from functools import lru_cache
 
 from config import (
     INPUT_DIR,
+    OUTPUT_DIR,
     YEAR_RANGE,
     DATE_COLUMNS,
     COLUMN_TRANSLATIONS,
@@ -324,18 +326,40 @@ class DataAnalyzer:
         return stats
 
 
+@lru_cache(maxsize=16)
+def _get_palette(name: str, n_colors: int) -> Tuple[Tuple[float, ...], ...]:
+    """Sample a seaborn palette once per (name, size) as plain RGB tuples."""
+    return tuple(sns.color_palette(name, n_colors=n_colors))
+
+
 class Visualizer:
     """Handles all visualization and plotting operations."""
 
-    def __init__(self):
+    def __init__(self, batch_mode: bool = False, output_dir: str = OUTPUT_DIR):
         self.config = VIZ_CONFIG
         self.numeric_cols = ANALYSIS_CONFIG["numeric_cols"]
         self.categorical_cols = ANALYSIS_CONFIG["categorical_cols"]
+        self.batch_mode = batch_mode
+        self.output_dir = Path(output_dir)
 
         # Set default style
         sns.set_style(self.config["style"])
         plt.rcParams["figure.dpi"] = self.config["dpi"]
 
+    def _finalize_figure(self, fig: plt.Figure, name: str) -> None:
+        """Show the figure, or save it as PNG and close it in batch mode."""
+        if not self.batch_mode:
+            plt.show()
+            return
+
+        # Headless batch rendering: never raise DPI above the figure's own
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        fig.savefig(
+            self.output_dir / f"{name}.png",
+            dpi=min(fig.dpi, self.config["batch_dpi"]),
+        )
+        plt.close(fig)
+
     def _setup_plot_style(self, fig: plt.Figure, ax: plt.Axes) -> None:
         """Apply consistent styling to plots."""
         fig.patch.set_facecolor(self.config["background_color"])
@@ -390,9 +414,9 @@ class Visualizer:
             "Numeric\nColumns",
             "Categorical\nColumns",
         ]
-        colors1 = sns.color_palette(self.config["color_palette"], n_colors=4)
+        colors1 = _get_palette(self.config["color_palette"], 4)
 
-        bars1 = ax1.bar(
+        ax1.bar(
             overview_labels,
             overview_data,
             color=colors1,
@@ -404,12 +428,12 @@ class Visualizer:
         )
         ax1.set_ylabel("Count", fontsize=12)
 
-        # Add value labels on bars
-        for bar in bars1:
-            height = bar.get_height()
+        # Add value labels on bars (categorical bars are centred on 0..n-1)
+        label_offset = max(overview_data) * 0.01
+        for x, height in enumerate(overview_data):
             ax1.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height + max(overview_data) * 0.01,
+                x,
+                height + label_offset,
                 f"{int(height):,}",
                 ha="center",
                 va="bottom",
@@ -471,7 +495,7 @@ class Visualizer:
         volume_labels = ["Data Cells", "Missing Cells"]
         colors4 = ["#3498DB", "#E74C3C"]
 
-        bars4 = ax4.bar(
+        ax4.bar(
             volume_labels,
             volume_data,
             color=colors4,
@@ -484,12 +508,12 @@ class Visualizer:
         ax4.set_ylabel("Number of Cells", fontsize=12)
 
         # Add value labels with smart formatting
-        for bar in bars4:
-            height = bar.get_height()
+        label_offset = max(volume_data) * 0.01
+        for x, height in enumerate(volume_data):
             formatted_height = self._format_large_number(height)
             ax4.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height + max(volume_data) * 0.01,
+                x,
+                height + label_offset,
                 formatted_height,
                 ha="center",
                 va="bottom",
@@ -497,7 +521,7 @@ class Visualizer:
             )
 
         plt.subplots_adjust(top=0.90, bottom=0.1, left=0.1, right=0.95)
-        plt.show()
+        self._finalize_figure(fig, "summary_stats")
         return fig
 
     def create_price_distribution_plot(
@@ -560,7 +584,7 @@ class Visualizer:
         ax.grid(axis="x", alpha=0.3, linestyle="--")
 
         plt.tight_layout()
-        plt.show()
+        self._finalize_figure(fig, "price_distribution")
         return fig
 
     def create_brand_price_comparison_plot(
@@ -579,11 +603,11 @@ class Visualizer:
         fig, ax = plt.subplots(1, 1, figsize=(14, 10))
 
         # Create vertical bar plot
-        colors = sns.color_palette(
+        colors = _get_palette(
             self.config["color_palette"], len(filtered_brands)
         )
 
-        bars = ax.bar(
+        ax.bar(
             x=range(len(filtered_brands)),
             height=filtered_brands.values,
             color=colors,
@@ -593,10 +617,11 @@ class Visualizer:
         )
 
         # Add value labels on top of bars
-        for i, (bar, value) in enumerate(zip(bars, filtered_brands.values)):
+        label_offset = max(filtered_brands) * 0.01
+        for x, value in enumerate(filtered_brands.values):
             ax.text(
-                bar.get_x() + bar.get_width() / 2,
-                value + max(filtered_brands) * 0.01,
+                x,
+                value + label_offset,
                 f"${value:.0f}",
                 ha="center",
                 va="bottom",
@@ -655,7 +680,7 @@ class Visualizer:
 
         legend.get_title().set_fontweight("bold")
         plt.tight_layout()
-        plt.show()
+        self._finalize_figure(fig, "brand_price_comparison")
         return fig
 
     def create_categorical_analysis_plots(
@@ -686,10 +711,10 @@ class Visualizer:
                 fig, ax = plt.subplots(1, 1, figsize=(12, 8))
 
                 # Create bar plot
-                colors = sns.color_palette(
+                colors = _get_palette(
                     self.config["color_palette"], len(top_categories)
                 )
-                bars = ax.bar(
+                ax.bar(
                     range(len(top_categories)),
                     top_categories.values,
                     color=colors,
@@ -705,29 +730,26 @@ class Visualizer:
                     fontsize=12,
                     fontweight="bold",
                 )
-                ax.set_xticks(range(len(top_categories)))
-                ax.set_xticklabels(
-                    [
-                        str(x)[:15] + "..." if len(str(x)) > 15 else str(x)
-                        for x in top_categories.index
-                    ],
-                    rotation=45,
-                    ha="right",
+                # Truncate long category names in one vectorized pass
+                tick_labels = top_categories.index.map(str)
+                tick_labels = tick_labels.where(
+                    tick_labels.str.len() <= 15, tick_labels.str[:15] + "..."
                 )
+                ax.set_xticks(range(len(top_categories)))
+                ax.set_xticklabels(tick_labels, rotation=45, ha="right")
 
                 # Set logarithmic scale on y-axis
                 ax.set_yscale("log")
 
                 # Add value labels on bars with formatted values
-                for bar in bars:
-                    height = bar.get_height()
+                for x, height in enumerate(top_categories.values):
                     formatted_value = self._format_value(height)
                     # Position label slightly above the bar in log space
                     label_y = (
                         height * 1.1
                     )  # Multiply by factor for log scale positioning
                     ax.text(
-                        bar.get_x() + bar.get_width() / 2.0,
+                        x,
                         label_y,
                         f"${formatted_value}",
                         ha="center",
@@ -740,7 +762,9 @@ class Visualizer:
                 ax.grid(axis="y", alpha=0.1, linestyle="-", which="minor")
 
                 plt.tight_layout()
-                plt.show()
+                self._finalize_figure(
+                    fig, "top_" + col.lower().replace(" ", "_")
+                )
                 categorical_plots.append(fig)
 
         print(
@@ -752,12 +776,19 @@ class Visualizer:
 class AeratorDataProcessor:
     """Main orchestrator class that coordinates all components."""
 
-    def __init__(self, input_dir: str = INPUT_DIR):
+    def __init__(
+        self,
+        input_dir: str = INPUT_DIR,
+        batch_mode: bool = False,
+        output_dir: str = OUTPUT_DIR,
+    ):
         self.input_dir = input_dir
         self.loader = DataLoader(input_dir)
         self.cleaner = DataCleaner()
         self.analyzer = DataAnalyzer()
-        self.visualizer = Visualizer()
+        self.visualizer = Visualizer(
+            batch_mode=batch_mode, output_dir=output_dir
+        )
 
         self.raw_data: Optional[Dict[str, pd.DataFrame]] = None
         self.combined_data: Optional[pd.DataFrame] = None
@@ -5,6 +5,7 @@ Contains all mappings, constants, and settings.
 
 # Data paths
 INPUT_DIR = "../../../data/raw/aquaculture/aerator_imports/"
+OUTPUT_DIR = "../../../reports/figures/aerator_imports/"
 YEAR_RANGE = range(2021, 2025)
 
 # Date columns that need conversion
@@ -176,5 +177,7 @@ VIZ_CONFIG = {
     "color_palette": "Spectral",
     "background_color": "lightblue",
     "dpi": 100,
+    # Upper bound on save DPI for Visualizer(batch_mode=True)
+    "batch_dpi": 72,
     "style": "whitegrid",
 }
@@ -0,0 +1,40 @@
+"""Lazy, optional numba compilation shared by the utility modules."""
+
+import importlib.util
+from functools import lru_cache, partial
+
+
+@lru_cache(maxsize=None)
+def _numba_available() -> bool:
+    """Whether numba is installed, checked without importing it."""
+    return importlib.util.find_spec("numba") is not None
+
+
+def _compile_cached(decorator, func):
+    """
+    Apply a numba decorator factory with its on-disk cache enabled.
+
+    The cache is keyed by source file, not import path, so an entry written
+    while the module was imported as ``src.utils`` fails to load under
+    ``utils`` (and vice versa). Compile afresh without the cache then.
+    """
+    try:
+        return decorator(cache=True)(func)
+    except ModuleNotFoundError:
+        return decorator(cache=False)(func)
+
+
+@lru_cache(maxsize=None)
+def _jit(func, signature: str, fastmath: bool = False):
+    """
+    Compile a kernel with numba on first use.
+
+    numba is only imported here, so importing the utility modules stays
+    cheap. With ``cache=True`` later sessions load the compiled code from
+    disk. Returns the plain Python function when numba is not installed.
+    """
+    if not _numba_available():
+        return func
+    from numba import njit
+
+    return _compile_cached(partial(njit, signature, fastmath=fastmath), func)
@@ -5,6 +5,55 @@ import numpy as np
 from typing import Union, List, Optional, Dict, Any
 
 
+def compute_fill_values(
+    df: pd.DataFrame,
+    strategy: str = "mean",
+    has_missing: Optional[pd.Series] = None,
+) -> pd.Series:
+    """
+    Compute per-column fill values for the columns that have missing values.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The DataFrame to aggregate
+    strategy : str, default 'mean'
+        Aggregate to use: 'mean', 'median' or 'mode'
+    has_missing : pd.Series, optional
+        Per-column ``df.isna().any()`` if the caller already has it
+
+    Returns
+    -------
+    pd.Series
+        Fill value per column, suitable for ``DataFrame.fillna`` or for
+        ``clean_missing_values(df, strategy='fill', fill_value=...)``
+
+    Examples
+    --------
+    >>> values = compute_fill_values(df, strategy='median')
+    >>> clean_missing_values(other_df, strategy='fill', fill_value=values)
+    """
+    # Columns without missing values never need an aggregate
+    if has_missing is None:
+        has_missing = df.isna().any()
+    missing = df.loc[:, has_missing]
+
+    if strategy == "mean":
+        return missing.mean(numeric_only=True)
+    elif strategy == "median":
+        return missing.median(numeric_only=True)
+    elif strategy == "mode":
+        modes = missing.mode()
+        if modes.empty:
+            # Only all-missing columns left: nothing to fill them with
+            return pd.Series(dtype=object)
+        return modes.iloc[0]
+    else:
+        raise ValueError(
+            f"Unknown strategy: {strategy}. Use 'mean', 'median', or 'mode'"
+        )
+
+
 def clean_missing_values(
     df: pd.DataFrame, strategy: str = "drop", fill_value: Any = None
 ) -> pd.DataFrame:
@@ -18,7 +67,8 @@ def clean_missing_values(
     strategy : str, default 'drop'
         Strategy to handle missing values: 'drop', 'mean', 'median', 'mode', 'fill'
     fill_value : Any, default None
-        Value to use when strategy='fill'
+        Value to use when strategy='fill'. Pass the output of
+        ``compute_fill_values`` to reuse aggregates across frames.
 
     Returns
     -------
@@ -30,18 +80,21 @@ def clean_missing_values(
     >>> df = pd.DataFrame({'A': [1, 2, np.nan], 'B': [4, np.nan, 6]})
     >>> clean_missing_values(df, strategy='mean')
     """
-    df_cleaned = df.copy()
-
+    # dropna and fillna already return new DataFrames, so no upfront copy
     if strategy == "drop":
-        df_cleaned = df_cleaned.dropna()
-    elif strategy == "mean":
-        df_cleaned = df_cleaned.fillna(df_cleaned.mean(numeric_only=True))
-    elif strategy == "median":
-        df_cleaned = df_cleaned.fillna(df_cleaned.median(numeric_only=True))
-    elif strategy == "mode":
-        df_cleaned = df_cleaned.fillna(df_cleaned.mode().iloc[0])
+        df_cleaned = df.dropna()
+    elif strategy in ("mean", "median", "mode"):
+        # One missing-value scan, shared with compute_fill_values
+        has_missing = df.isna().any()
+        if has_missing.any():
+            df_cleaned = df.fillna(
+                compute_fill_values(df, strategy, has_missing)
+            )
+        else:
+            # Nothing to fill: skip the column aggregates
+            df_cleaned = df.copy()
     elif strategy == "fill":
-        df_cleaned = df_cleaned.fillna(fill_value)
+        df_cleaned = df.fillna(fill_value)
     else:
         raise ValueError(
             f"Unknown strategy: {strategy}. Use 'drop', 'mean', 'median', 'mode', or 'fill'"
@@ -78,25 +131,22 @@ def detect_outliers(
     if columns is None:
         columns = df.select_dtypes(include=[np.number]).columns.tolist()
 
-    outlier_mask = pd.DataFrame(False, index=df.index, columns=columns)
-
-    for col in columns:
-        if method == "iqr":
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            outlier_mask[col] = (df[col] < lower_bound) | (
-                df[col] > upper_bound
-            )
-        elif method == "zscore":
-            z_scores = (df[col] - df[col].mean()) / df[col].std()
-            outlier_mask[col] = abs(z_scores) > threshold
-        else:
-            raise ValueError(
-                f"Unknown method: {method}. Use 'iqr' or 'zscore'"
-            )
+    # Evaluate all columns at once; column statistics broadcast across rows
+    data = df[columns]
+
+    if method == "iqr":
+        quartiles = data.quantile([0.25, 0.75])
+        Q1 = quartiles.iloc[0]
+        Q3 = quartiles.iloc[1]
+        IQR = Q3 - Q1
+        lower_bound = Q1 - 1.5 * IQR
+        upper_bound = Q3 + 1.5 * IQR
+        outlier_mask = (data < lower_bound) | (data > upper_bound)
+    elif method == "zscore":
+        z_scores = (data - data.mean()) / data.std()
+        outlier_mask = z_scores.abs() > threshold
+    else:
+        raise ValueError(f"Unknown method: {method}. Use 'iqr' or 'zscore'")
 
     return outlier_mask
 
@@ -123,30 +173,31 @@ def encode_categorical(
     pd.DataFrame
         DataFrame with encoded variables
     """
-    df_encoded = df.copy()
-
     if columns is None:
         columns = df.select_dtypes(
             include=["object", "category"]
         ).columns.tolist()
 
     if method == "onehot":
-        df_encoded = pd.get_dummies(
-            df_encoded, columns=columns, drop_first=False
-        )
-    elif method == "label":
-        from sklearn.preprocessing import LabelEncoder
+        # get_dummies already returns a new DataFrame
+        return pd.get_dummies(df, columns=columns, drop_first=False)
+
+    # Label/ordinal encoding replace columns, so work on a copy
+    df_encoded = df.copy()
 
-        le = LabelEncoder()
+    if method == "label":
+        # Sorted codes over the string values, as sklearn's LabelEncoder
         for col in columns:
-            df_encoded[col] = le.fit_transform(df_encoded[col].astype(str))
+            codes, _ = pd.factorize(
+                df_encoded[col].astype(str), sort=True, use_na_sentinel=False
+            )
+            df_encoded[col] = codes
     elif method == "ordinal":
         # For ordinal encoding, we'd need to specify the order of categories
-        # This is just a placeholder implementation
+        # This is just a placeholder implementation (order of appearance)
         for col in columns:
-            categories = df_encoded[col].unique()
-            mapping = {category: i for i, category in enumerate(categories)}
-            df_encoded[col] = df_encoded[col].map(mapping)
+            codes, _ = pd.factorize(df_encoded[col], use_na_sentinel=False)
+            df_encoded[col] = codes
     else:
         raise ValueError(
             f"Unknown method: {method}. Use 'onehot', 'label', or 'ordinal'"
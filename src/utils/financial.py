@@ -1,9 +1,36 @@
 """Financial utilities for data analysis projects."""
 
+from functools import lru_cache, partial
+
 import pandas as pd
 import numpy as np
 from typing import Union, List, Dict, Tuple, Optional
 
+from ._numba import _compile_cached, _jit, _numba_available
+
+# Explicit numba signatures, compiled eagerly on first use
+_IRR_NEWTON_SIGNATURE = (
+    "Tuple((float64, boolean))(float64[::1], float64, float64, int64)"
+)
+_DECLINING_BALANCE_SIGNATURE = (
+    "Tuple((float64[::1], float64[::1]))(float64, float64, int64, float64)"
+)
+_NPV_SIGNATURE = "void(float64, float64[:], float64[:])"
+
+
+def _discount_factors(
+    rate: Union[float, np.ndarray], periods: int
+) -> np.ndarray:
+    """Discount factors (1 + rate)^-t for t = 0..periods-1 via cumprod.
+
+    An array of rates gives one row of factors per rate.
+    """
+    rate = np.asarray(rate, dtype=np.float64)
+    factors = np.empty(rate.shape + (periods,))
+    factors[..., :1] = 1.0
+    factors[..., 1:] = (1.0 / (1.0 + rate))[..., np.newaxis]
+    return np.cumprod(factors, axis=-1, out=factors)
+
 
 def calculate_npv(
     cash_flows: List[float],
@@ -32,14 +59,116 @@ def calculate_npv(
     >>> calculate_npv([-1000, 200, 300, 400, 500], 0.1)
     180.67
     """
+    cf = np.asarray(cash_flows, dtype=np.float64)
     if initial_investment is not None:
-        cash_flows = [-abs(initial_investment)] + cash_flows
-
-    return sum(
-        cf / (1 + discount_rate) ** t for t, cf in enumerate(cash_flows)
+        cf = np.concatenate(([-abs(initial_investment)], cf))
+
+    return float(np.dot(cf, _discount_factors(discount_rate, cf.size)))
+
+
+def _npv_kernel(rate, cf, out):
+    # Discount factors by running multiplication, no pow per period
+    inv = 1.0 / (1.0 + rate)
+    discount = 1.0
+    total = 0.0
+    for t in range(cf.shape[0]):
+        total += cf[t] * discount
+        discount *= inv
+    out[0] = total
+
+
+@lru_cache(maxsize=None)
+def _npv_gufunc():
+    """Build the (),(t)->() NPV gufunc on first use."""
+    from numba import guvectorize
+
+    return _compile_cached(
+        partial(
+            guvectorize,
+            [_NPV_SIGNATURE],
+            "(),(t)->()",
+            nopython=True,
+            fastmath=True,
+        ),
+        _npv_kernel,
     )
 
 
+def calculate_npv_batch(
+    cash_flows: Union[List[float], np.ndarray],
+    discount_rates: Union[List[float], np.ndarray],
+) -> np.ndarray:
+    """
+    Calculate NPVs for several discount rates (and cash flow series) at once.
+
+    Parameters
+    ----------
+    cash_flows : array-like
+        Cash flows of shape (T,) shared by all rates, or (R, T) with one
+        series per rate. Leading axes broadcast against the rates, so
+        (S, 1, T) evaluates S series at every rate. Period 0 is
+        undiscounted.
+    discount_rates : array-like
+        Discount rates as decimals, shape (R,). A scalar rate is treated
+        as shape (1,).
+
+    Returns
+    -------
+    np.ndarray
+        Net Present Value per rate, shape (R,), or the broadcast shape
+        of the leading cash flow axes and the rates, e.g. (S, R)
+
+    Examples
+    --------
+    >>> calculate_npv_batch([-1000, 200, 300, 400, 500], [0.05, 0.1, 0.15])
+    array([219.47,  71.78, -50.36])
+    >>> flows = np.array([[-1000, 200, 300, 400, 500], [-500, 300, 300, 0, 0]])
+    >>> calculate_npv_batch(flows[:, np.newaxis], [0.05, 0.1])
+    array([[219.47, 71.78],
+           [ 57.82, 20.66]])
+    """
+    cf = np.asarray(cash_flows, dtype=np.float64)
+    rates = np.atleast_1d(np.asarray(discount_rates, dtype=np.float64))
+
+    if _numba_available():
+        # Compiled gufunc, broadcast over the rates and leading cash flow axes
+        return _npv_gufunc()(rates, cf)
+
+    # (R, T) discount factors broadcast against the cash flow periods
+    discount_factors = _discount_factors(rates, cf.shape[-1])
+    return np.sum(cf * discount_factors, axis=-1)
+
+
+def _irr_newton(
+    cf: np.ndarray, guess: float, tolerance: float, max_iterations: int
+) -> Tuple[float, bool]:
+    """Newton-Raphson IRR over a float64 cash flow array.
+
+    NPV and its derivative are accumulated in a single pass per iteration.
+    Returns the rate and whether it converged.
+    """
+    rate = guess
+    for _ in range(max_iterations):
+        base = 1.0 + rate
+        if base <= 0.0:
+            return rate, False
+        inv = 1.0 / base
+        npv = 0.0
+        d_npv = 0.0
+        discount = 1.0
+        for t in range(cf.size):
+            npv += cf[t] * discount
+            d_npv -= t * cf[t] * discount * inv
+            discount *= inv
+        if d_npv == 0.0:
+            return rate, False
+        step = npv / d_npv
+        rate -= step
+        if abs(step) < tolerance:
+            return rate, True
+    return rate, False
+
+
 def calculate_irr(
     cash_flows: List[float],
     guess: float = 0.1,
@@ -72,21 +201,44 @@ def calculate_irr(
     """
     from scipy import optimize
 
+    cf = np.ascontiguousarray(cash_flows, dtype=np.float64)
+    t_cf = np.arange(cf.size) * cf
+
     def npv_equation(rate):
-        return sum(cf / (1 + rate) ** t for t, cf in enumerate(cash_flows))
+        return np.dot(cf, _discount_factors(rate, cf.size))
 
-    try:
-        irr = optimize.newton(
-            npv_equation, guess, tol=tolerance, maxiter=max_iterations
+    def npv_derivative(rate):
+        discount = _discount_factors(rate, cf.size)
+        return -np.dot(t_cf, discount) / (1 + rate)
+
+    if _numba_available():
+        # Compiled Newton-Raphson; no Python dispatch per iteration
+        irr_newton = _jit(_irr_newton, _IRR_NEWTON_SIGNATURE, fastmath=True)
+        irr, converged = irr_newton(
+            cf, float(guess), float(tolerance), int(max_iterations)
         )
-        return irr
-    except RuntimeError:
-        # If Newton-Raphson fails, try bisection method
+        if converged:
+            return irr
+    else:
         try:
-            irr = optimize.brentq(npv_equation, -0.999, 1000)
+            # Analytic derivative: true Newton steps instead of secant
+            irr = optimize.newton(
+                npv_equation,
+                guess,
+                fprime=npv_derivative,
+                tol=tolerance,
+                maxiter=max_iterations,
+            )
             return irr
-        except ValueError:
-            return np.nan
+        except RuntimeError:
+            pass
+
+    # If Newton-Raphson fails, try bisection method
+    try:
+        irr = optimize.brentq(npv_equation, -0.999, 1000)
+        return irr
+    except ValueError:
+        return np.nan
 
 
 def calculate_payback_period(
@@ -118,34 +270,29 @@ def calculate_payback_period(
         )
 
     investment = abs(cash_flows[0])
-    cash_flows = cash_flows[1:]  # Remove initial investment
-
-    if cumulative:
-        cum_cash_flows = np.cumsum(cash_flows)
-        for i, cf in enumerate(cum_cash_flows):
-            if cf >= investment:
-                # If exact period found
-                if cf == investment:
-                    return i + 1
-                # Interpolate between periods
-                if i > 0:
-                    prev_cf = cum_cash_flows[i - 1]
-                    fraction = (investment - prev_cf) / (cf - prev_cf)
-                    return i + fraction
-                else:
-                    fraction = investment / cf
-                    return fraction
+    # Remove initial investment
+    flows = np.asarray(cash_flows[1:], dtype=np.float64)
+    cum_cash_flows = np.cumsum(flows)
+
+    # First period in which the investment is recovered; cumulative flows
+    # need not be monotonic, so locate the crossing with a mask
+    recovered = np.flatnonzero(cum_cash_flows >= investment)
+    if recovered.size == 0:
         # If investment not recovered within given periods
         return float("inf")
+    i = int(recovered[0])
+    cf = cum_cash_flows[i]
+
+    if cumulative:
+        # If exact period found
+        if cf == investment:
+            return i + 1
+        # Interpolate between periods
+        prev_cf = cum_cash_flows[i - 1] if i > 0 else 0.0
+        return i + (investment - prev_cf) / (cf - prev_cf)
     else:
         # Simple payback calculation
-        recovered = 0
-        for i, cf in enumerate(cash_flows):
-            recovered += cf
-            if recovered >= investment:
-                return i + 1 - (recovered - investment) / cf
-        # If investment not recovered within given periods
-        return float("inf")
+        return i + 1 - (cf - investment) / flows[i]
 
 
 def calculate_roi(
@@ -234,35 +381,67 @@ def create_loan_amortization_schedule(
     rate_per_period = annual_interest_rate / payments_per_year
     num_payments = years * payments_per_year
 
-    # Calculate payment amount
-    payment = (
-        principal
-        * (rate_per_period * (1 + rate_per_period) ** num_payments)
-        / ((1 + rate_per_period) ** num_payments - 1)
+    # Closed-form balance after each period:
+    # B_k = P(1+r)^k - A((1+r)^k - 1) / r
+    periods = np.arange(1, num_payments + 1)
+    growth = (1.0 + rate_per_period) ** periods
+
+    # Calculate payment amount from the final growth factor (1+r)^n
+    growth_n = float(growth[-1])
+    payment = principal * rate_per_period * growth_n / (growth_n - 1.0)
+
+    balance = principal * growth - payment * (growth - 1) / rate_per_period
+    opening_balance = np.concatenate(([principal], balance[:-1]))
+
+    interest_payment = opening_balance * rate_per_period
+    principal_payment = payment - interest_payment
+
+    return pd.DataFrame(
+        {
+            "Period": periods,
+            "Payment": np.full(num_payments, payment),
+            "Principal": principal_payment,
+            "Interest": interest_payment,
+            # Avoid negative balance due to rounding
+            "Balance": np.maximum(balance, 0),
+        },
+        copy=False,
     )
 
-    # Initialize amortization schedule
-    schedule = []
-    balance = principal
 
-    for period in range(1, num_payments + 1):
-        interest_payment = balance * rate_per_period
-        principal_payment = payment - interest_payment
-        balance -= principal_payment
+def _declining_balance_schedule(
+    cost: float, salvage_value: float, useful_life: int, rate: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Fill declining-balance depreciation and book values year by year.
 
-        schedule.append(
-            {
-                "Period": period,
-                "Payment": payment,
-                "Principal": principal_payment,
-                "Interest": interest_payment,
-                "Balance": max(
-                    0, balance
-                ),  # Avoid negative balance due to rounding
-            }
+    Switches to straight-line once that gives the higher charge. Book
+    values are reported clipped at the salvage value.
+    """
+    depreciation = np.empty(useful_life)
+    reported_value = np.empty(useful_life)
+    book_value = cost
+
+    for year in range(useful_life):
+        # Switch to straight-line if it gives higher depreciation
+        straight_line_amount = (book_value - salvage_value) / (
+            useful_life - year
         )
+        declining_amount = book_value * rate
+
+        # Use the higher of declining balance or straight-line
+        if (
+            straight_line_amount > declining_amount
+            and book_value > salvage_value
+        ):
+            amount = straight_line_amount
+        else:
+            amount = min(declining_amount, book_value - salvage_value)
 
-    return pd.DataFrame(schedule)
+        book_value -= amount
+        depreciation[year] = amount
+        reported_value[year] = max(book_value, salvage_value)
+
+    return depreciation, reported_value
 
 
 def calculate_depreciation(
@@ -299,21 +478,21 @@ def calculate_depreciation(
     >>> schedule
     """
     depreciable_amount = cost - salvage_value
-    schedule = []
+
+    years = np.arange(1, useful_life + 1)
 
     if method == "straight_line":
-        annual_depreciation = depreciable_amount / useful_life
-        book_value = cost
-
-        for year in range(1, useful_life + 1):
-            book_value -= annual_depreciation
-            schedule.append(
-                {
-                    "Year": year,
-                    "Depreciation": annual_depreciation,
-                    "Book Value": max(book_value, salvage_value),
-                }
-            )
+        depreciation = np.full(useful_life, depreciable_amount / useful_life)
+        book_value = cost - np.cumsum(depreciation)
+
+        return pd.DataFrame(
+            {
+                "Year": years,
+                "Depreciation": depreciation,
+                "Book Value": np.maximum(book_value, salvage_value),
+            },
+            copy=False,
+        )
 
     elif method in ["declining_balance", "double_declining"]:
         if method == "double_declining":
@@ -321,60 +500,41 @@ def calculate_depreciation(
         else:
             depreciation_rate = 1 / useful_life
 
-        book_value = cost
-
-        for year in range(1, useful_life + 1):
-            # Switch to straight-line if it gives higher depreciation
-            remaining_years = useful_life - year + 1
-            straight_line_amount = (
-                (book_value - salvage_value) / remaining_years
-                if remaining_years > 0
-                else 0
-            )
+        declining_balance_schedule = _jit(
+            _declining_balance_schedule, _DECLINING_BALANCE_SIGNATURE
+        )
+        depreciation, book_value = declining_balance_schedule(
+            float(cost),
+            float(salvage_value),
+            useful_life,
+            float(depreciation_rate),
+        )
 
-            declining_amount = book_value * depreciation_rate
-
-            # Use the higher of declining balance or straight-line
-            if (
-                straight_line_amount > declining_amount
-                and book_value > salvage_value
-            ):
-                depreciation = straight_line_amount
-            else:
-                depreciation = min(
-                    declining_amount, book_value - salvage_value
-                )
-
-            book_value -= depreciation
-
-            schedule.append(
-                {
-                    "Year": year,
-                    "Depreciation": depreciation,
-                    "Book Value": max(book_value, salvage_value),
-                }
-            )
+        return pd.DataFrame(
+            {
+                "Year": years,
+                "Depreciation": depreciation,
+                "Book Value": book_value,
+            },
+            copy=False,
+        )
 
     elif method == "sum_of_years":
-        sum_of_years = sum(range(1, useful_life + 1))
-        book_value = cost
-
-        for year in range(1, useful_life + 1):
-            depreciation_rate = (useful_life - year + 1) / sum_of_years
-            depreciation = depreciable_amount * depreciation_rate
-            book_value -= depreciation
-
-            schedule.append(
-                {
-                    "Year": year,
-                    "Depreciation": depreciation,
-                    "Book Value": max(book_value, salvage_value),
-                }
-            )
+        sum_of_years = useful_life * (useful_life + 1) // 2
+        depreciation_rate = (useful_life - years + 1) / sum_of_years
+        depreciation = depreciable_amount * depreciation_rate
+        book_value = cost - np.cumsum(depreciation)
+
+        return pd.DataFrame(
+            {
+                "Year": years,
+                "Depreciation": depreciation,
+                "Book Value": np.maximum(book_value, salvage_value),
+            },
+            copy=False,
+        )
 
     else:
         raise ValueError(
             f"Unknown method: {method}. Use 'straight_line', 'declining_balance', 'double_declining', or 'sum_of_years'"
         )
-
-    return pd.DataFrame(schedule)
@@ -6,6 +6,11 @@ import os
 import json
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 
 def create_notebook_template(
     output_path: str, title: str, author: str = "Luis Paulo Vinatea Barberena"
@@ -108,7 +113,10 @@ def create_notebook_template(
 
     # Create notebook JSON
     notebook = {
-        "cells": cells,
+        # nbformat accepts each cell source as a single string
+        "cells": [
+            {**cell, "source": "".join(cell["source"])} for cell in cells
+        ],
         "metadata": {
             "kernelspec": {
                 "display_name": "Python 3",
@@ -130,8 +138,12 @@ def create_notebook_template(
     }
 
     # Write to file
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(notebook, f, indent=1)
+    if orjson is not None:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(notebook, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(notebook, f, indent=1)
 
     print(f"Notebook template created successfully at {output_path}")
 
@@ -6,6 +6,55 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from typing import Optional, List, Tuple, Union
 
+from ._numba import _jit, _numba_available
+
+# Bar plots with more bars than this are rasterized in vector output
+RASTERIZE_MIN_BARS = 100
+
+# Explicit numba signature for the streaming moments kernel
+_MOMENTS_SIGNATURE = (
+    "Tuple((int64, float64, float64, float64, float64))(float64[::1])"
+)
+
+
+def _moments(x: np.ndarray) -> Tuple[int, float, float, float, float]:
+    """Streaming count, mean, variance, skewness and excess kurtosis.
+
+    Welford-style update of the central moment sums in one pass. Variance
+    uses ddof=1; skewness and kurtosis are the biased estimates, matching
+    scipy.stats defaults.
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    for value in x:
+        n1 = n
+        n += 1
+        delta = value - mean
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        term = delta * delta_n * n1
+        mean += delta_n
+        m4 += (
+            term * delta_n2 * (n * n - 3 * n + 3)
+            + 6.0 * delta_n2 * m2
+            - 4.0 * delta_n * m3
+        )
+        m3 += term * delta_n * (n - 2) - 3.0 * delta_n * m2
+        m2 += term
+
+    if n == 0:
+        return n, np.nan, np.nan, np.nan, np.nan
+    variance = m2 / (n - 1) if n > 1 else np.nan
+    if m2 == 0.0:
+        # Constant values: zero spread, shape statistics undefined
+        return n, mean, variance, np.nan, np.nan
+    skewness = np.sqrt(n) * m3 / m2**1.5
+    kurtosis = n * m4 / (m2 * m2) - 3.0
+    return n, mean, variance, skewness, kurtosis
+
 
 def plot_correlation_matrix(
     df: pd.DataFrame,
@@ -33,7 +82,25 @@ def plot_correlation_matrix(
     annotate : bool, default True
         Whether to annotate the cells with correlation values
     """
-    corr = df.corr(method=method)
+    numeric = df.select_dtypes(include=["number", "bool"])
+
+    corr = None
+    if method == "pearson":
+        values = numeric.to_numpy(dtype=np.float64)
+        if not np.isnan(values).any():
+            # Centre in float64 before downcasting so large offsets (e.g.
+            # timestamps, prices) keep their precision, then one BLAS-backed
+            # float32 pass
+            values = values - values.mean(axis=0)
+            values = values.astype(np.float32)
+            corr = pd.DataFrame(
+                np.corrcoef(values, rowvar=False, dtype=np.float32),
+                index=numeric.columns,
+                columns=numeric.columns,
+            )
+    if corr is None:
+        # Pairwise-complete handling of missing values and rank methods
+        corr = numeric.corr(method=method)
 
     # Create mask for upper triangle
     mask = None
@@ -55,6 +122,8 @@ def plot_correlation_matrix(
         fmt=".2f",
         square=True,
         linewidths=0.5,
+        # One image for the mesh instead of a vector patch per cell
+        rasterized=True,
     )
 
     plt.title(f"Correlation Matrix ({method.capitalize()})", fontsize=16)
@@ -96,16 +165,36 @@ def plot_distribution(
     plt.tight_layout()
     plt.show()
 
+    # Moments, skewness and kurtosis from a single pass over the values
+    values = df[column].to_numpy(dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        # Empty or all-NaN column: NaN statistics, as Series.describe gives
+        count, mean, variance, skewness, kurtosis = 0, *[np.nan] * 4
+        quantiles = np.full(5, np.nan)
+    else:
+        if _numba_available():
+            moments = _jit(_moments, _MOMENTS_SIGNATURE)
+            count, mean, variance, skewness, kurtosis = moments(values)
+        else:
+            from scipy import stats
+
+            count, _, mean, variance, skewness, kurtosis = stats.describe(
+                values
+            )
+        quantiles = np.percentile(values, [0, 25, 50, 75, 100])
+
     # Display descriptive statistics
-    desc_stats = df[column].describe()
+    desc_stats = pd.Series(
+        [count, mean, np.sqrt(variance), *quantiles],
+        index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"],
+        name=column,
+        dtype=np.float64,
+    )
     print(f"Descriptive Statistics for {column}:")
     print(desc_stats)
 
     # Check for skewness and kurtosis
-    from scipy import stats
-
-    skewness = stats.skew(df[column].dropna())
-    kurtosis = stats.kurtosis(df[column].dropna())
     print(f"Skewness: {skewness:.4f}")
     print(f"Kurtosis: {kurtosis:.4f}")
 
@@ -126,7 +215,9 @@ def plot_missing_values(
     plt.figure(figsize=figsize)
 
     # Calculate missing values percentage
-    missing = (df.isnull().sum() / len(df)) * 100
+    # count() reads validity masks directly; no boolean frame is built
+    missing_counts = len(df) - df.count()
+    missing = (missing_counts / len(df)) * 100
     missing = missing[missing > 0].sort_values(ascending=False)
 
     if missing.empty:
@@ -134,7 +225,11 @@ def plot_missing_values(
         return
 
     # Plot
-    sns.barplot(x=missing.index, y=missing.values)
+    sns.barplot(
+        x=missing.index,
+        y=missing.values,
+        rasterized=len(missing) > RASTERIZE_MIN_BARS,
+    )
 
     plt.title("Percentage of Missing Values by Column", fontsize=16)
     plt.xlabel("Columns")
@@ -151,7 +246,7 @@ def plot_missing_values(
             {
                 "Column": missing.index,
                 "Missing Values (%)": missing.values,
-                "Missing Count": df[missing.index].isnull().sum().values,
+                "Missing Count": missing_counts[missing.index].values,
             }
         )
     )
@@ -205,11 +300,19 @@ def plot_categorical_counts(
 
     # Create plot
     if horizontal:
-        sns.barplot(x=value_counts.values, y=value_counts.index)
+        sns.barplot(
+            x=value_counts.values,
+            y=value_counts.index,
+            rasterized=len(value_counts) > RASTERIZE_MIN_BARS,
+        )
         plt.xlabel("Count")
         plt.ylabel(column)
     else:
-        sns.barplot(x=value_counts.index, y=value_counts.values)
+        sns.barplot(
+            x=value_counts.index,
+            y=value_counts.values,
+            rasterized=len(value_counts) > RASTERIZE_MIN_BARS,
+        )
         plt.xlabel(column)
         plt.ylabel("Count")
         plt.xticks(rotation=45, ha="right")
@@ -222,5 +325,11 @@ def plot_categorical_counts(
     # Print percentage distribution
     percentage = value_counts / value_counts.sum() * 100
     print(f"Distribution of {column}:")
-    for i, (val, count) in enumerate(value_counts.items()):
-        print(f"{val}: {count} ({percentage.iloc[i]:.2f}%)")
+    print(
+        "\n".join(
+            f"{val}: {count} ({pct:.2f}%)"
+            for val, count, pct in zip(
+                value_counts.index, value_counts.values, percentage.values
+            )
+        )
+    )
@@ -0,0 +1,81 @@
+"""Compiled numba kernels must agree with their NumPy/scipy fallbacks."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("numba")
+
+from src.utils import financial, visualization
+
+CASH_FLOWS = [
+    [-1000.0, 300.0, 400.0, 500.0],
+    [-5000.0, 1200.0, 1500.0, 1800.0, 2000.0, 2500.0],
+    [-100.0, 10.0, 10.0, 10.0],
+]
+
+
+def _without_numba(monkeypatch, module):
+    monkeypatch.setattr(module, "_numba_available", lambda: False)
+
+
+@pytest.mark.parametrize("cash_flows", CASH_FLOWS)
+def test_irr_kernel_matches_scipy(cash_flows, monkeypatch):
+    compiled = financial.calculate_irr(cash_flows)
+    _without_numba(monkeypatch, financial)
+    fallback = financial.calculate_irr(cash_flows)
+
+    assert compiled == pytest.approx(fallback, abs=1e-6)
+
+
+@pytest.mark.parametrize("method", ["declining_balance", "double_declining"])
+def test_declining_balance_kernel_matches_python(method, monkeypatch):
+    compiled = financial.calculate_depreciation(10000, 1000, 7, method=method)
+    _without_numba(monkeypatch, financial)
+    fallback = financial.calculate_depreciation(10000, 1000, 7, method=method)
+
+    pd.testing.assert_frame_equal(compiled, fallback)
+
+
+@pytest.mark.parametrize(
+    "cash_flows, rates",
+    [
+        (CASH_FLOWS[0], [0.05, 0.1, 0.15]),
+        (np.array(CASH_FLOWS[:1] * 2), [0.05, 0.1]),
+        (
+            np.array([[-1000, 200, 300, 400, 500], [-500, 300, 300, 0, 0]])[
+                :, np.newaxis
+            ],
+            [0.05, 0.1, 0.2],
+        ),
+        (CASH_FLOWS[1], 0.08),
+    ],
+    ids=["shared", "paired", "grid", "scalar_rate"],
+)
+def test_npv_gufunc_matches_numpy(cash_flows, rates, monkeypatch):
+    compiled = financial.calculate_npv_batch(cash_flows, rates)
+    _without_numba(monkeypatch, financial)
+    fallback = financial.calculate_npv_batch(cash_flows, rates)
+
+    assert compiled.shape == fallback.shape
+    np.testing.assert_allclose(compiled, fallback, rtol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.random.default_rng(0).lognormal(size=500),
+        np.full(20, 3.0),
+        np.array([2.0]),
+        np.empty(0),
+    ],
+    ids=["lognormal", "constant", "single", "empty"],
+)
+def test_moments_kernel_matches_python(values):
+    compiled = visualization._jit(
+        visualization._moments, visualization._MOMENTS_SIGNATURE
+    )
+
+    np.testing.assert_allclose(
+        compiled(values), visualization._moments(values), rtol=1e-12
+    )
@@ -0,0 +1,79 @@
+"""Tests for src.utils.visualization."""
+
+import re
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils import visualization
+
+
+def _distribution_output(df, column, monkeypatch, capsys, use_numba):
+    # Drive the numba branch with the plain Python kernel so both code
+    # paths can be compared without numba installed
+    monkeypatch.setattr(visualization, "_numba_available", lambda: use_numba)
+    monkeypatch.setattr(visualization, "_jit", lambda func, *args: func)
+    monkeypatch.setattr(visualization.plt, "show", lambda: None)
+    visualization.plot_distribution(df, column)
+    visualization.plt.close("all")
+    return capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.full(50, 3.0),
+        np.array([3.0] + [np.nan] * 9),
+        np.random.default_rng(0).lognormal(size=200),
+    ],
+    ids=["constant", "single", "lognormal"],
+)
+def test_plot_distribution_kernel_matches_scipy(values, monkeypatch, capsys):
+    df = pd.DataFrame({"x": values})
+
+    scipy_out = _distribution_output(df, "x", monkeypatch, capsys, False)
+    kernel_out = _distribution_output(df, "x", monkeypatch, capsys, True)
+
+    assert kernel_out == scipy_out
+
+
+def test_plot_distribution_constant_column_has_zero_std(monkeypatch, capsys):
+    df = pd.DataFrame({"x": np.full(50, 3.0)})
+
+    out = _distribution_output(df, "x", monkeypatch, capsys, True)
+
+    assert re.search(r"^std\s+0\.0$", out, re.MULTILINE)
+    assert "Skewness: nan" in out
+
+
+def test_moments_empty_input():
+    count, mean, variance, skewness, kurtosis = visualization._moments(
+        np.empty(0)
+    )
+
+    assert count == 0
+    assert np.isnan([mean, variance, skewness, kurtosis]).all()
+
+
+def test_plot_correlation_matrix_large_offset_column(monkeypatch):
+    # Epoch-seconds style offsets must not swamp float32 precision
+    index = np.arange(200, dtype=np.float64)
+    df = pd.DataFrame({"timestamp": 1.7e9 + index, "index": index})
+    captured = {}
+
+    def fake_heatmap(data, **kwargs):
+        captured["corr"] = data
+
+    monkeypatch.setattr(visualization.sns, "heatmap", fake_heatmap)
+    monkeypatch.setattr(visualization.plt, "show", lambda: None)
+    visualization.plot_correlation_matrix(df)
+    visualization.plt.close("all")
+
+    np.testing.assert_allclose(
+        captured["corr"].to_numpy(), df.corr().to_numpy(), atol=1e-4
+    )